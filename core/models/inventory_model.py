@@ -20,6 +20,7 @@ class InventoryItem: Defines the InventoryItem
  - def days_since_verification(): Returns the number of days since the stored verification date
  - def create(): Creates a new inventory row after normalizing all fields.
  - def get_all_for_user(): Returns all inventory items for a user
+ - def get_toner_summary_for_user(): Returns a user's toner stock (model, color, quantity) per (model, description)
  - def update(): Updates an item by id
  - def delete_by_part_number(): Deletes one inventory item tied to a specific user and part number
  - def add_quantity(): Increases inventory for a given part and user
@@ -163,6 +164,43 @@ class InventoryItem:
         finally:
             conn.close()
 
+    @staticmethod
+    def get_toner_summary_for_user(user="default_user"):
+        # Returns (MODEL, COLOR, quantity) rows for a user's toner items: rows whose
+        # description mentions TONER and a toner color, grouped by trimmed, uppercased model and
+        # description, with negative or missing quantities counted as 0. Trimming strips tabs
+        # and line breaks as well as spaces, as str.strip() does. COLOR is the first of
+        # BLACK, CYAN, MAGENTA, YELLOW found in the description. Rows come back in the order each
+        # group first appears (by id). The filtering, color matching and summing run in SQLite,
+        # so only the grouped rows are returned instead of every inventory item.
+        conn = get_connection()
+        try:
+            cur = conn.cursor()
+            cur.execute("""
+                SELECT m, color, SUM(qty)
+                FROM (
+                    SELECT id, upper(trim(model, ' ' || char(9, 10, 11, 12, 13))) AS m,
+                           upper(trim(part_description, ' ' || char(9, 10, 11, 12, 13))) AS d,
+                           CASE
+                               WHEN instr(upper(part_description), 'BLACK') > 0 THEN 'BLACK'
+                               WHEN instr(upper(part_description), 'CYAN') > 0 THEN 'CYAN'
+                               WHEN instr(upper(part_description), 'MAGENTA') > 0 THEN 'MAGENTA'
+                               WHEN instr(upper(part_description), 'YELLOW') > 0 THEN 'YELLOW'
+                           END AS color,
+                           MAX(COALESCE(CAST(quantity AS INTEGER), 0), 0) AS qty
+                    FROM inventory_items
+                    WHERE user=?
+                      AND trim(COALESCE(model, ''), ' ' || char(9, 10, 11, 12, 13)) <> ''
+                      AND instr(upper(part_description), 'TONER') > 0
+                )
+                WHERE color IS NOT NULL
+                GROUP BY m, d
+                ORDER BY MIN(id)
+            """, (user,))
+            return cur.fetchall()
+        finally:
+            conn.close()
+
     @staticmethod
     def update(item_id, **kw):
         # Updates an item by id, ensuring fields are sanitized before being written.
@@ -264,5 +302,18 @@ class InventoryItem:
                     # ^ Silently logs if the column already exists or other ALTER issues arise.
                     print(f"[DB] Warning: could not add '{col_name}' column:", e)
 
+        # Partial index over in-stock rows, for part pickers that list quantity > 0 parts
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_inv_qty ON inventory_items(quantity) WHERE quantity > 0"
+        )
+        # Covering index for per-user lookups: the toner summary reads user, description, model
+        # and quantity (plus the rowid id) straight from it, without touching the table rows.
+        # It replaces the earlier (user, part_description)-only idx_inv_user_desc.
+        cur.execute("DROP INDEX IF EXISTS idx_inv_user_desc")
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_inv_user_toner "
+            "ON inventory_items(user, part_description, model, quantity)"
+        )
+
         conn.commit()
         conn.close()
\ No newline at end of file
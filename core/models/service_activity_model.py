@@ -48,6 +48,14 @@ model_signals = ModelSignals()
 
 # Service Activity
 class ServiceActivity:
+    # Fixed attribute layout: the table model reads these per cell, and slot descriptors are
+    # cheaper than a per-instance __dict__. "controller" is attached by the edit/delete flows.
+    __slots__ = (
+        "id", "area", "customer", "serial_number", "meter", "malfunction", "arrival_date",
+        "arrival_time", "remedial_action", "quantity", "part_replaced", "departure_date",
+        "departure_time", "call_duration", "technician", "comments", "user", "controller",
+    )
+
     def __init__(
         self, id=None, area=None, customer=None, serial_number=None, meter=None,
         malfunction=None, arrival_date=None, arrival_time=None, remedial_action=None,
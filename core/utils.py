@@ -1,3 +1,5 @@
+from calendar import monthrange
+from functools import lru_cache
 from datetime import datetime
 import re
 from PySide6.QtCore import Qt
@@ -27,9 +29,16 @@ core.utils.py index:
 - def validate_date_string(): Validates that a date string matches the expected format
 - def validate_time_string(): Validates user-entered time strings in AM/PM format
 - def normalize_route(): Normalizes a route string
+- def pointing_cursor(): Shared pointing-hand cursor for clickable buttons
 - def style_button(): Applies the theme to the page
 """
 
+# Shape checks used by the validators so they don't have to build a datetime just to say yes/no.
+# The field patterns are the ones strptime uses for "%Y-%m-%d" and "%I:%M %p", and they are
+# applied with fullmatch, so the validators accept exactly what parse_date/parse_time accept.
+_DATE_RE = re.compile(r"(\d\d\d\d)-(1[0-2]|0[1-9]|[1-9])-(3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])")
+_TIME_RE = re.compile(r"(1[0-2]|0[1-9]|[1-9]):([0-5]\d|\d)\s+(am|pm)", re.IGNORECASE)
+
 # These helpers clean unpredictable user input and standardize values across the app.
 def safe_str(value) -> str:
     # Converts any value into a clean, trimmed string, returning an empty string for None.
@@ -80,14 +89,36 @@ def parse_time(time_str: str) -> datetime | None:
     except ValueError:
         return None
 
+def _parse_date_fields(date_str: str) -> tuple[int, int, int] | None:
+    # Splits a 'YYYY-MM-DD' string into (year, month, day) without building a datetime.
+    m = _DATE_RE.fullmatch(date_str) if date_str else None
+    if not m:
+        return None
+    year, month, day = int(m.group(1)), int(m.group(2)), int(m.group(3))
+    # The pattern already bounds month and day; only year 0 and day-of-month remain
+    if year < 1 or day > monthrange(year, month)[1]:
+        return None
+    return year, month, day
+
+
+def _parse_time_fields(time_str: str) -> tuple[int, int] | None:
+    # Splits a 12-hour time string like '3:45 PM' into 24-hour (hour, minute).
+    m = _TIME_RE.fullmatch(time_str.strip()) if time_str else None
+    if not m:
+        return None
+    hour, minute = int(m.group(1)) % 12, int(m.group(2))
+    if m.group(3).upper() == "PM":
+        hour += 12
+    return hour, minute
+
 # These utilities merge date and time fields and compute safe duration differences.
 def combine_datetime(date_str: str, time_str: str) -> datetime | None:
     # Combines a date string and time string into a datetime, returning None if either is invalid.
-    d = parse_date(date_str)
-    t = parse_time(time_str)
+    d = _parse_date_fields(date_str)
+    t = _parse_time_fields(time_str)
     if not d or not t:
         return None
-    return datetime(d.year, d.month, d.day,t.hour, t.minute)
+    return datetime(d[0], d[1], d[2], t[0], t[1])
 
 
 def diff_hours_minutes(dt_start: datetime, dt_end: datetime) -> tuple[int, int]:
@@ -101,7 +132,10 @@ def diff_hours_minutes(dt_start: datetime, dt_end: datetime) -> tuple[int, int]:
 # Helper functions for lightweight and exception-free input validation.
 def is_empty(value) -> bool:
     # Returns True if a value is empty after trimming.
-    return safe_str(value) == ""
+    if value is None:
+        return True
+    s = value if type(value) is str else str(value)
+    return not s or not s.strip()
 
 def non_empty(value: str, field_name="Field") -> tuple[bool, str]:
     # Validates that a field contains text, returning (success, message).
@@ -111,13 +145,13 @@ def non_empty(value: str, field_name="Field") -> tuple[bool, str]:
 
 def validate_date_string(date_str: str) -> tuple[bool, str]:
     # Validates that a date string matches the expected format.
-    if not parse_date(date_str):
+    if not _parse_date_fields(date_str):
         return False, f"Invalid date: {date_str}"
     return True, ""
 
 def validate_time_string(time_str: str) -> tuple[bool, str]:
     # Validates user-entered time strings in AM/PM format.
-    if not parse_time(time_str):
+    if not _parse_time_fields(time_str):
         return False, f"Invalid time: {time_str}"
     return True, ""
 
@@ -137,8 +171,14 @@ def normalize_route(route: str) -> tuple[str, str] | None:
 
 # Applies the theme to the page, used in equipment info, expense report, inventory,
 # mileage, parts, and the service activity page.
+@lru_cache(maxsize=1)
+def pointing_cursor() -> QCursor:
+    # One pointing-hand cursor shared by every clickable button, built on first use (after the
+    # QApplication exists) instead of once per button.
+    return QCursor(Qt.PointingHandCursor)
+
 def style_button(btn, color: str):
-    btn.setCursor(QCursor(Qt.PointingHandCursor))
+    btn.setCursor(pointing_cursor())
     btn.setStyleSheet(f"""
         QPushButton {{
             background-color: {color};
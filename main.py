@@ -8,11 +8,17 @@ This is the entry point of the application and runs when the program starts. It
 database, sets up Qt, shows the login screen, and launches the main window after login.
 """
 
+# The App class is imported lazily to avoid circular dependencies during startup,
+# and cached here so the import only runs on the first login.
+_APP_CLS = None
+
 # Launches the main application window after a successful login.
-# Imported lazily to avoid circular dependencies during startup.
 def launch_main_window():
-    from app import App
-    win = App()
+    global _APP_CLS
+    if _APP_CLS is None:
+        from app import App
+        _APP_CLS = App
+    win = _APP_CLS()
     win.show()
 
 # The following code runs only when this file is executed directly.
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Callable, Optional, Dict, Tuple
 from PySide6.QtCore import Qt, QRect, QEvent
 from PySide6.QtGui import QPainter, QColor
@@ -14,8 +15,12 @@ interactive row-level controls within any table-based interface.
 
 ui.components.action_buttons.action_buttons_delegate.py index:
 
+def cached_qcolor(): Returns a shared QColor for a hex string, parsed once
+def repaint_hover(): Repaints just the action cells whose hover state changed
+def connect_row_changes(): Calls a slot whenever the rows of a view's model change
 class ActionButtonsDelegate(): Draws small inline action buttons inside a QTableView cell
  - def __init__(): Initializes ActionButtonsDelegate
+ - def _clear_rects(): Drops cached button rects after the model's rows change
  - def compute_actions_width(): Returns width needed to fit given # of action buttons
  - def required_width(): Convenience wrapper — returns the exact Actions column width
  - def paint(): Draws the button shapes and text
@@ -23,6 +28,33 @@ class ActionButtonsDelegate(): Draws small inline action buttons inside a QTable
  - def editorEvent(): Checks if user hovered or clicked a button
 """
 
+@lru_cache(maxsize=64)
+def cached_qcolor(hex_: str) -> QColor:
+    # Button colors are a handful of fixed hex strings; parse each once and reuse the QColor
+    # on every paint instead of building a new one per button per cell.
+    return QColor(hex_)
+
+def repaint_hover(view, col: int, *hovers):
+    # Repaints only the cells whose hover highlight changed instead of the whole viewport,
+    # so the model isn't re-queried for every visible cell on each hover change. Each hover
+    # is a (row, button) tuple or None.
+    if not isinstance(view, QTableView) or view.model() is None:
+        return
+    model = view.model()
+    for hover in hovers:
+        if hover is not None:
+            view.viewport().update(view.visualRect(model.index(hover[0], col)))
+
+def connect_row_changes(view, slot: Callable):
+    # Connects 'slot' to every signal after which rows may have moved (reset, re-sort or
+    # re-filter, rows inserted or removed), so a delegate can drop state keyed by row.
+    # Does nothing if 'view' has no model yet.
+    model = view.model() if hasattr(view, "model") else None
+    if model is None:
+        return
+    for signal in (model.modelReset, model.layoutChanged, model.rowsInserted, model.rowsRemoved):
+        signal.connect(slot)
+
 class ActionButtonsDelegate(QStyledItemDelegate):
 # Draws small inline action buttons inside a QTableView cell; supports up to
 # three mini-buttons: 'edit' (blue), 'delete' (red), and 'order' (green).
@@ -46,6 +78,15 @@ class ActionButtonsDelegate(QStyledItemDelegate):
         # Stored as: (row, "edit") or None
         self._hovered_button: Optional[Tuple[int, str]] = None
 
+        # Rects are keyed by (row, col), so they go stale whenever rows shift; clear them
+        # on any structural change so the cache only ever holds cells painted since then.
+        connect_row_changes(parent, self._clear_rects)
+
+    def _clear_rects(self, *args):
+        # Drops cached button rects and hover state after the model's rows change.
+        self._rects.clear()
+        self._hovered_button = None
+
     # Button size calculation for column auto-sizing
     @staticmethod
     def compute_actions_width(button_count: int) -> int:
@@ -91,7 +132,7 @@ class ActionButtonsDelegate(QStyledItemDelegate):
             btn_rect = rects_for_cell[btn_key]
 
             hovered = (self._hovered_button == (row, btn_key))
-            color = QColor(hover if hovered else base)
+            color = cached_qcolor(hover if hovered else base)
 
             painter.setBrush(color)
             painter.setPen(Qt.NoPen)
@@ -135,19 +176,19 @@ class ActionButtonsDelegate(QStyledItemDelegate):
 
             # Only update if it actually changed
             if new_hover != self._hovered_button:
+                old_hover = self._hovered_button
                 self._hovered_button = new_hover
 
-                # Redraw table viewport to show hover highlight
-                if isinstance(self.parent(), QTableView):
-                    self.parent().viewport().update()
+                # Redraw the affected cells to show the hover highlight
+                repaint_hover(self.parent(), index.column(), old_hover, new_hover)
             return False
 
         # Upon mouse leave remove hover highlight
         if etype == QEvent.Type.Leave:
             if self._hovered_button is not None:
+                old_hover = self._hovered_button
                 self._hovered_button = None
-                if isinstance(self.parent(), QTableView):
-                    self.parent().viewport().update()
+                repaint_hover(self.parent(), index.column(), old_hover)
             return False
 
         # Detect click upon mouse button release
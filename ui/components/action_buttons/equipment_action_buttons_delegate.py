@@ -1,7 +1,10 @@
 from __future__ import annotations
 from PySide6.QtCore import Qt, QRect, QEvent, QSortFilterProxyModel
-from PySide6.QtGui import QPainter, QColor
+from PySide6.QtGui import QPainter
 from PySide6.QtWidgets import QStyledItemDelegate, QTableView, QApplication
+from ui.components.action_buttons.action_buttons_delegate import (
+    cached_qcolor, connect_row_changes, repaint_hover
+)
 
 """
 This module provides the EquipmentActionButtonDelegate, a custom table-cell delegate used in the 
@@ -16,6 +19,7 @@ ui.components.action_buttons.equipment_action_buttons_delegate.py index:
 
 class EquipmentActionButtonDelegate(): Delegate for Equipment Info actions column.
  - def __init__(): Initializes EquipmentActionButtonDelegate
+ - def _clear_rects(): Drops cached button rects after the model's rows change
  - def paint(): Draws the button shapes and text
      - def draw_btn(): Helper: Draw a single mini button
  - def editorEvent(): hover + click detection
@@ -36,6 +40,15 @@ class EquipmentActionButtonDelegate(QStyledItemDelegate):
         # hovered status
         self._hovered = None
 
+        # Rects are keyed by (row, col), so they go stale whenever rows shift; clear them
+        # on any structural change so the cache only ever holds cells painted since then.
+        connect_row_changes(parent, self._clear_rects)
+
+    def _clear_rects(self, *args):
+        # Drops cached button rects and hover state after the model's rows change.
+        self._rects.clear()
+        self._hovered = None
+
     def paint(self, painter, option, index):
         rect = option.rect
         h = 26
@@ -58,7 +71,7 @@ class EquipmentActionButtonDelegate(QStyledItemDelegate):
 
         def draw_btn(r, text, base, hover, key):
             hovered = (self._hovered == (index.row(), key))
-            color = QColor(hover if hovered else base)
+            color = cached_qcolor(hover if hovered else base)
 
             painter.save()
             painter.setRenderHint(QPainter.Antialiasing, True)
@@ -92,17 +105,17 @@ class EquipmentActionButtonDelegate(QStyledItemDelegate):
                     break
 
             if new_hover != self._hovered:
+                old_hover = self._hovered
                 self._hovered = new_hover
-                if self.parent():
-                    self.parent().viewport().update()
+                repaint_hover(self.parent(), index.column(), old_hover, new_hover)
 
             return False
 
         if etype == QEvent.Leave:
             if self._hovered is not None:
+                old_hover = self._hovered
                 self._hovered = None
-                if self.parent():
-                    self.parent().viewport().update()
+                repaint_hover(self.parent(), index.column(), old_hover)
             return False
 
         # Click handling
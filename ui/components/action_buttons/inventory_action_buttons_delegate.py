@@ -1,7 +1,10 @@
 from __future__ import annotations
 from PySide6.QtCore import Qt, QRect, QEvent
-from PySide6.QtGui import QPainter, QColor
+from PySide6.QtGui import QPainter
 from PySide6.QtWidgets import QStyledItemDelegate, QTableView, QApplication
+from ui.components.action_buttons.action_buttons_delegate import (
+    cached_qcolor, connect_row_changes, repaint_hover
+)
 
 """
 This module implements the InventoryActionButtonDelegate, a custom table-cell delegate that renders 
@@ -15,6 +18,7 @@ ui.components.action_buttons.inventory_action_buttons_delegate.py index:
 
 class InventoryActionButtonDelegate(): Responsible for drawing the 'Order', 'Edit', 'Delete' buttons
  - def __init__(): Initializes InventoryActionButtonDelegate
+ - def _clear_rects(): Drops cached button rects after the model's rows change
  - def paint(): Draws the button shapes and text
      - def draw_btn(): Helper: Draw a single mini button
  - def editorEvent(): hover + click detection
@@ -31,6 +35,15 @@ class InventoryActionButtonDelegate(QStyledItemDelegate):
         self._rects: dict[tuple[int, int], dict[str, QRect]] = {}
         self._hovered_button = None
 
+        # Rects are keyed by (row, col), so they go stale whenever rows shift; clear them
+        # on any structural change so the cache only ever holds cells painted since then.
+        connect_row_changes(parent, self._clear_rects)
+
+    def _clear_rects(self, *args):
+        # Drops cached button rects and hover state after the model's rows change.
+        self._rects.clear()
+        self._hovered_button = None
+
     def paint(self, painter, option, index):
         # Draw 'Order', 'Edit', 'Delete' buttons in 'Actions' column;
 
@@ -59,7 +72,7 @@ class InventoryActionButtonDelegate(QStyledItemDelegate):
         def draw_btn(r: QRect, text: str, base_color: str, hover_color: str, btn_key: str):
             # Helper to draw a single rounded button with hover effect.
             hovered = (self._hovered_button == (index.row(), btn_key))
-            color = QColor(hover_color if hovered else base_color)
+            color = cached_qcolor(hover_color if hovered else base_color)
             painter.save()
             painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
             painter.setBrush(color)
@@ -88,17 +101,19 @@ class InventoryActionButtonDelegate(QStyledItemDelegate):
             for btn_key, r in rmap.items():
                 if r.contains(pos):
                     if self._hovered_button != (index.row(), btn_key):
-                        # Remember which button is hovered and repaint cell.
+                        # Remember which button is hovered and repaint the affected cells.
+                        old_hover = self._hovered_button
                         self._hovered_button = (index.row(), btn_key)
-                        self.parent().viewport().update()
+                        repaint_hover(self.parent(), index.column(), old_hover, self._hovered_button)
                     break
             return False
 
         # Mouse left the cell
         if event.type() == QEvent.Leave:
             if self._hovered_button is not None:
+                old_hover = self._hovered_button
                 self._hovered_button = None
-                self.parent().viewport().update()
+                repaint_hover(self.parent(), index.column(), old_hover)
             return False
 
         # User released mouse button
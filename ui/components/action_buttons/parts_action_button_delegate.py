@@ -1,13 +1,14 @@
 from __future__ import annotations
-from typing import Optional, Dict
-from PySide6.QtCore import Qt, QRect, QEvent, QModelIndex
-from PySide6.QtGui import QPainter, QColor
-from PySide6.QtWidgets import QStyledItemDelegate, QApplication
+from typing import Optional, Tuple
+from PySide6.QtCore import Qt, QRect, QPointF, QEvent, QModelIndex, QTimer
+from PySide6.QtGui import QPainter, QColor, QBrush, QPen, QStaticText, QTransform
+from PySide6.QtWidgets import QStyledItemDelegate, QTableView, QApplication
+from ui.components.action_buttons.action_buttons_delegate import connect_row_changes
 
 """
 This module provides the PartsActionDelegate, a custom item delegate used in the Parts table to 
 display inline Edit and Delete buttons within each row’s action column. It draws the buttons with 
-hover effects, records their on-screen positions for hit detection, and listens for mouse events 
+hover effects, derives their on-screen positions from the cell for hit detection, and listens for mouse events 
 to determine when the user hovers over or clicks a specific action. When a button is clicked, the 
 delegate maps the table index back to the source model and triggers the appropriate callback, 
 enabling clean, interactive row-level editing and deletion directly from the table.
@@ -16,6 +17,11 @@ ui.components.action_buttons.parts_action_button_delegate.py index:
 
 class PartsActionButtonDelegate(): Delegate for Parts actions column.
  - def __init__(): Initializes PartsActionButtonDelegate
+ - def _reset_hover(): Drops the hover state after the model's rows change
+ - def _schedule_hover_update(): Queues a throttled hover repaint
+ - def _flush_hover_update(): Repaints the cells whose hover state changed
+ - def _button_geometry(): Lays out the buttons inside a cell
+ - def _hit_test(): Returns which button contains a point
  - def paint(): Draws the button shapes and text
      - def draw_btn(): Helper: Draw a single mini button
  - def editorEvent(): hover + click detection
@@ -23,97 +29,174 @@ class PartsActionButtonDelegate(): Delegate for Parts actions column.
 
 # Delegate that draws and handles edit/delete buttons.
 class PartsActionDelegate(QStyledItemDelegate):
+    # The only event types editorEvent acts on; everything else goes straight to Qt
+    _HANDLED_EVENTS = (QEvent.MouseMove, QEvent.Leave, QEvent.MouseButtonRelease)
 
-    def __init__(self, parent=None, on_edit=None, on_delete=None):
+    # Button sizes and positions
+    _BTN_H = 24
+    _BTN_W = 70
+    _SPACING = 8
+    # Smallest cell that fits both buttons; anything smaller is painted as a plain cell
+    _MIN_W = 2 * _BTN_W + 3 * _SPACING
+
+    def __init__(self, parent=None, on_edit=None, on_delete=None, beep_on_click=True):
         super().__init__(parent)
         self.on_edit = on_edit
         self.on_delete = on_delete
+        # Click feedback beep, as on the other action delegates; QApplication.beep() can block
+        # the GUI thread while the sound plays, so callers may turn it off
+        self.beep_on_click = beep_on_click
 
-        # Stores the clickable rectangles for each row
-        self._rects: Dict[tuple[int, int], Dict[str, QRect]] = {}
         self._hovered_button: Optional[tuple[int, str]] = None
 
+        # Button colors are fixed, so build the brushes/pen once instead of per paint
+        self._brush_edit = QBrush(QColor("#0066cc"))
+        self._brush_edit_hover = QBrush(QColor("#3399ff"))
+        self._brush_del = QBrush(QColor("#cc0000"))
+        self._brush_del_hover = QBrush(QColor("#ff3333"))
+        self._pen_text = QPen(Qt.white)
+
+        # Labels never change, so lay them out once; prepared against the view font on first paint
+        self._st_edit = QStaticText("Edit")
+        self._st_delete = QStaticText("Delete")
+        self._st_prepared = False
+
+        # Hover repaints are coalesced through a short single-shot timer (~60 Hz)
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(16)
+        self._hover_timer.timeout.connect(self._flush_hover_update)
+        # (row, col) cells whose hover highlight changed since the last flush
+        self._hover_dirty: set[tuple[int, int]] = set()
+
+        # Hover state is keyed by row, so it goes stale whenever rows shift
+        connect_row_changes(parent, self._reset_hover)
+
+    def _reset_hover(self, *args):
+        # Drops the hover state after the model's rows change.
+        self._hovered_button = None
+
+    def _schedule_hover_update(self, *cells: tuple[int, int]):
+        # Marks the given (row, col) cells for repaint and queues a flush unless one is pending.
+        self._hover_dirty.update(cells)
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
+
+    def _flush_hover_update(self):
+        # Repaints only the cells whose hover highlight changed, not the whole viewport.
+        view = self.parent()
+        cells, self._hover_dirty = self._hover_dirty, set()
+        if view is None or view.model() is None:
+            return
+        model = view.model()
+        viewport = view.viewport()
+        for row, col in cells:
+            viewport.update(view.visualRect(model.index(row, col)))
+
+    @classmethod
+    def _button_geometry(cls, cell_rect: QRect) -> Tuple[int, int, int, int, int]:
+        # Lays out the buttons inside a cell as (x, y, w, h, delete_x). Both paint and
+        # editorEvent derive it from the cell rect, so no per-cell geometry is stored.
+        h, w, spacing = cls._BTN_H, cls._BTN_W, cls._SPACING
+        x = cell_rect.x() + spacing
+        y = cell_rect.y() + (cell_rect.height() - h) // 2
+        return x, y, w, h, x + w - 1 + spacing
+
+    @staticmethod
+    def _hit_test(geom: Tuple[int, int, int, int, int], pos) -> Optional[str]:
+        # Returns which button ('edit' or 'delete') contains pos, or None.
+        x, y, w, h, del_x = geom
+        px, py = pos.x(), pos.y()
+        if not y <= py < y + h:
+            return None
+        if x <= px < x + w:
+            return "edit"
+        if del_x <= px < del_x + w:
+            return "delete"
+        return None
+
     def paint(self, painter: QPainter, option, index: QModelIndex):
         # Draws the Edit and Delete button graphics inside the table cell.
 
+        # Skip the buttons when the cell is too small to show them (e.g. mid-layout)
         rect = option.rect
-        row = index.row()
-        col = index.column()
+        if rect.width() < self._MIN_W or rect.height() < self._BTN_H:
+            return super().paint(painter, option, index)
 
-        # Button sizes and positions
-        h = 24
-        w = 70
-        spacing = 8
-        y = rect.y() + (rect.height() - h) // 2
-
-        edit_rect = QRect(rect.x() + spacing, y, w, h)
-        del_rect = QRect(edit_rect.right() + spacing, y, w, h)
+        row = index.row()
 
-        # Save button rectangles for click detection later
-        self._rects[(row, col)] = {
-            "edit": edit_rect,
-            "delete": del_rect,
-        }
+        x, y, w, h, del_x = self._button_geometry(option.rect)
+        edit_rect = QRect(x, y, w, h)
+        del_rect = QRect(del_x, y, w, h)
 
         painter.save()
         painter.setRenderHint(QPainter.Antialiasing, True)
 
+        if not self._st_prepared:
+            self._st_edit.prepare(QTransform(), painter.font())
+            self._st_delete.prepare(QTransform(), painter.font())
+            self._st_prepared = True
+
         # Helper to draw each button
-        def draw_btn(r: QRect, label: str, base: str, hover: str, key: str):
+        def draw_btn(r: QRect, label: QStaticText, brush_base: QBrush, brush_hover: QBrush, key: str):
             hovered = (self._hovered_button == (row, key))
-            color = QColor(hover if hovered else base)
 
-            painter.setBrush(color)
+            painter.setBrush(brush_hover if hovered else brush_base)
             painter.setPen(Qt.NoPen)
             painter.drawRoundedRect(r, 6, 6)
 
-            painter.setPen(Qt.white)
-            painter.drawText(r, Qt.AlignCenter, label)
+            # Center the pre-laid-out label inside the button
+            size = label.size()
+            painter.setPen(self._pen_text)
+            painter.drawStaticText(
+                QPointF(r.x() + (r.width() - size.width()) / 2, r.y() + (r.height() - size.height()) / 2),
+                label,
+            )
 
         # Draw blue Edit and red Delete buttons
-        draw_btn(edit_rect, "Edit", "#0066cc", "#3399ff", "edit")
-        draw_btn(del_rect, "Delete", "#cc0000", "#ff3333", "delete")
+        draw_btn(edit_rect, self._st_edit, self._brush_edit, self._brush_edit_hover, "edit")
+        draw_btn(del_rect, self._st_delete, self._brush_del, self._brush_del_hover, "delete")
 
         painter.restore()
 
     def editorEvent(self, event, model, option, index: QModelIndex):
         # Handles hover and click events on the drawn buttons.
 
-        key = (index.row(), index.column())
-        if key not in self._rects:
-            return False
+        etype = event.type()
+        if etype not in self._HANDLED_EVENTS:
+            return super().editorEvent(event, model, option, index)
 
-        rmap = self._rects[key]
+        geom = self._button_geometry(option.rect)
         pos = event.position().toPoint() if hasattr(event, "position") else event.pos()
 
         # Hover handling
-        if event.type() == QEvent.MouseMove:
-            new_hover = None
-            for btn_key, r in rmap.items():
-                if r.contains(pos):
-                    new_hover = (index.row(), btn_key)
-                    break
-
-            if new_hover != self._hovered_button:
-                self._hovered_button = new_hover
-                if self.parent() is not None:
-                    self.parent().viewport().update()
+        if etype == QEvent.MouseMove:
+            btn_key = self._hit_test(geom, pos)
+            hovered = self._hovered_button
+
+            # Still over the same button (or still over none): nothing changed, bail out early
+            if hovered is None:
+                if btn_key is None:
+                    return False
+            elif btn_key == hovered[1] and hovered[0] == index.row():
+                return False
 
+            if hovered is not None:
+                self._schedule_hover_update((hovered[0], index.column()))
+            self._hovered_button = (index.row(), btn_key) if btn_key else None
+            self._schedule_hover_update((index.row(), index.column()))
             return False
 
         # Mouse left the cell > remove hover highlight
-        if event.type() == QEvent.Leave:
+        if etype == QEvent.Leave:
             if self._hovered_button is not None:
+                self._schedule_hover_update((self._hovered_button[0], index.column()))
                 self._hovered_button = None
-                if self.parent() is not None:
-                    self.parent().viewport().update()
             return False
 
         # Click handling
-        if event.type() == QEvent.MouseButtonRelease:
+        if etype == QEvent.MouseButtonRelease:
             view = self.parent()
-
-            from PySide6.QtWidgets import QTableView
             if not isinstance(view, QTableView):
                 return False
 
@@ -122,15 +205,12 @@ class PartsActionDelegate(QStyledItemDelegate):
             source_index = proxy.mapToSource(index)
             source_row = source_index.row()
 
-            clicked_key = None
-            for btn_key, r in rmap.items():
-                if r.contains(pos):
-                    clicked_key = btn_key
-                    break
+            clicked_key = self._hit_test(geom, pos)
             if not clicked_key:
                 return False
 
-            QApplication.beep()
+            if self.beep_on_click:
+                QApplication.beep()
 
             # Fire callbacks
             if clicked_key == "edit" and self.on_edit:
@@ -1,13 +1,14 @@
 from __future__ import annotations
 from typing import Optional
-from PySide6.QtCore import Qt, QRect, QEvent, QSortFilterProxyModel, QModelIndex
-from PySide6.QtGui import QPainter, QColor
+from PySide6.QtCore import Qt, QRect, QPointF, QEvent, QSortFilterProxyModel, QModelIndex, QTimer
+from PySide6.QtGui import QPainter, QColor, QBrush, QPen, QStaticText, QTransform, QPalette
 from PySide6.QtWidgets import QStyledItemDelegate, QTableView, QApplication
+from ui.components.action_buttons.action_buttons_delegate import connect_row_changes
 
 """
 This module implements the SAActionButtonDelegate, a custom delegate used in the Service Activity table 
 to display inline Edit and Delete buttons within each row’s Actions column. It draws the colored buttons 
-with hover effects, stores their on-screen geometry for accurate hit detection, and interprets mouse 
+with hover effects, derives their on-screen geometry from the cell for hit detection, and interprets mouse 
 events to determine when a button is hovered or clicked. When a click occurs, the delegate maps the index 
 back to the underlying source model and triggers the corresponding callback provided by the Service 
 Activity page. This keeps the UI responsive and interactive while keeping the delegate focused solely on 
@@ -17,6 +18,12 @@ ui.components.action_buttons.sa_action_button_delegate.py index:
 
 class SAActionButtonDelegate(): Delegate for Service Activity actions column.
  - def __init__(): Store callbacks and setup state.
+ - def _reset_hover(): Drops the hover state after the model's rows change
+ - def _schedule_hover_update(): Queues a throttled hover repaint
+ - def _flush_hover_update(): Repaints the cells whose hover state changed
+ - def _button_geometry(): Lays out the buttons inside a cell
+ - def _hit_test(): Returns which button contains a point
+ - def initStyleOption(): Applies the Actions column's cell colors
  - def paint(): Draws the button shapes and text
      - def draw_btn(): Helper: Draw a single mini button
  - def editorEvent(): hover + click detection
@@ -30,83 +37,180 @@ class SAActionButtonDelegate(QStyledItemDelegate):
     # anything about ServiceActivity, and only calls the provided callbacks with
     # source_row index.
 
+    # The only event types editorEvent acts on; everything else goes straight to Qt.
+    _HANDLED_EVENTS = (QEvent.MouseMove, QEvent.Leave, QEvent.MouseButtonRelease)
+
+    # Mini-button sizes and spacing.
+    _BTN_H = 26
+    _BTN_W = 64
+    _SPACING = 8
+    # Smallest cell that fits both buttons; anything smaller is painted as a plain cell.
+    _MIN_W = 2 * _BTN_W + 3 * _SPACING
+
     def __init__(self, parent=None, on_edit=None, on_delete=None):
         super().__init__(parent)
         self.on_edit = on_edit
         self.on_delete = on_delete
-        self._rects: dict[tuple[int, int], dict[str, QRect]] = {}
         self._hovered: Optional[tuple[int, str]] = None
 
+        # Button colors are fixed, so build the brushes/pen once instead of per paint
+        self._brush_edit = QBrush(QColor("#0066cc"))
+        self._brush_edit_hover = QBrush(QColor("#3399ff"))
+        self._brush_del = QBrush(QColor("#cc0000"))
+        self._brush_del_hover = QBrush(QColor("#ff3333"))
+        self._pen_text = QPen(Qt.white)
+        # Actions cell colors (tinted background, white text) used when the plain cell is drawn
+        self._brush_cell_bg = QBrush(QColor("#204050"))
+        self._brush_cell_fg = QBrush(Qt.white)
+
+        # Labels never change, so lay them out once; prepared against the view font on first paint
+        self._st_edit = QStaticText("Edit")
+        self._st_delete = QStaticText("Delete")
+        self._st_prepared = False
+
+        # Hover repaints are coalesced through a short single-shot timer (~60 Hz)
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(16)
+        self._hover_timer.timeout.connect(self._flush_hover_update)
+        # (row, col) cells whose hover highlight changed since the last flush
+        self._hover_dirty: set[tuple[int, int]] = set()
+
+        # Hover state is keyed by row, so it goes stale whenever rows shift.
+        connect_row_changes(parent, self._reset_hover)
+
+    def _reset_hover(self, *args):
+        # Drops the hover state after the model's rows change.
+        self._hovered = None
+
+    def _schedule_hover_update(self, *cells: tuple[int, int]):
+        # Marks the given (row, col) cells for repaint and queues a flush unless one is pending.
+        self._hover_dirty.update(cells)
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
+
+    def _flush_hover_update(self):
+        # Repaints only the cells whose hover highlight changed, not the whole viewport.
+        view = self.parent()
+        cells, self._hover_dirty = self._hover_dirty, set()
+        if view is None or view.model() is None:
+            return
+        model = view.model()
+        viewport = view.viewport()
+        for row, col in cells:
+            viewport.update(view.visualRect(model.index(row, col)))
+
+    @classmethod
+    def _button_geometry(cls, cell_rect: QRect) -> tuple[int, int, int, int, int]:
+        # Lays out the buttons inside a cell as (x, y, w, h, delete_x). Both paint and
+        # editorEvent derive it from the cell rect, so no per-cell geometry is stored.
+        h, w, spacing = cls._BTN_H, cls._BTN_W, cls._SPACING
+        x = cell_rect.x() + spacing
+        y = cell_rect.y() + (cell_rect.height() - h) // 2
+        return x, y, w, h, x + w - 1 + spacing
+
+    @staticmethod
+    def _hit_test(geom: tuple[int, int, int, int, int], pos) -> Optional[str]:
+        # Returns which button ('edit' or 'delete') contains pos, or None.
+        x, y, w, h, del_x = geom
+        px, py = pos.x(), pos.y()
+        if not y <= py < y + h:
+            return None
+        if x <= px < x + w:
+            return "edit"
+        if del_x <= px < del_x + w:
+            return "delete"
+        return None
+
     # Painting the mini-buttons
+    def initStyleOption(self, option, index: QModelIndex):
+        # The Actions column's colors live here rather than in the model, so data() is never
+        # asked to build brushes for them: slightly tinted background, white placeholder text.
+        super().initStyleOption(option, index)
+        option.backgroundBrush = self._brush_cell_bg
+        palette = option.palette
+        palette.setBrush(QPalette.Text, self._brush_cell_fg)
+        option.palette = palette
+
     def paint(self, painter: QPainter, option, index: QModelIndex):
+        # Skip the buttons when the cell is too small to show them (e.g. mid-layout).
         rect = option.rect
-        h = 26
-        w = 64
-        spacing = 8
-        y = rect.y() + (rect.height() - h) // 2
+        if rect.width() < self._MIN_W or rect.height() < self._BTN_H:
+            return super().paint(painter, option, index)
 
         # Calculate the rectangles where "Edit" and "Delete" will be drawn.
-        edit_rect = QRect(rect.x() + spacing, y, w, h)
-        del_rect = QRect(edit_rect.right() + spacing, y, w, h)
+        x, y, w, h, del_x = self._button_geometry(option.rect)
+        edit_rect = QRect(x, y, w, h)
+        del_rect = QRect(del_x, y, w, h)
 
-        # Cache these rectangles for this particular table cell.
-        self._rects[(index.row(), index.column())] = {
-            "edit": edit_rect,
-            "delete": del_rect,
-        }
+        # Painter state is shared by both buttons, so set it up once per cell.
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+
+        if not self._st_prepared:
+            self._st_edit.prepare(QTransform(), painter.font())
+            self._st_delete.prepare(QTransform(), painter.font())
+            self._st_prepared = True
 
         # Helper for drawing a single button.
-        def draw_btn(r: QRect, text: str, base: str, hover: str, key: str):
+        def draw_btn(r: QRect, label: QStaticText, brush_base: QBrush, brush_hover: QBrush, key: str):
             # Determine if THIS button is the one the mouse is currently over.
             hovered = (self._hovered == (index.row(), key))
-            color = QColor(hover if hovered else base)
 
-            painter.save()
-            painter.setRenderHint(QPainter.Antialiasing, True)
-            painter.setBrush(color)
-            painter.setPen(Qt.NoPen)
+            painter.setBrush(brush_hover if hovered else brush_base)
             painter.drawRoundedRect(r, 6, 6)
-            painter.setPen(Qt.white)
-            painter.drawText(r, Qt.AlignCenter, text)
-            painter.restore()
+
+            # Center the pre-laid-out label inside the button.
+            size = label.size()
+            painter.setPen(self._pen_text)
+            painter.drawStaticText(
+                QPointF(r.x() + (r.width() - size.width()) / 2, r.y() + (r.height() - size.height()) / 2),
+                label,
+            )
+            painter.setPen(Qt.NoPen)
 
         # Draw Edit (blue) and Delete (red) buttons.
-        draw_btn(edit_rect, "Edit", "#0066cc", "#3399ff", "edit")
-        draw_btn(del_rect, "Delete", "#cc0000", "#ff3333", "delete")
+        draw_btn(edit_rect, self._st_edit, self._brush_edit, self._brush_edit_hover, "edit")
+        draw_btn(del_rect, self._st_delete, self._brush_del, self._brush_del_hover, "delete")
+
+        painter.restore()
 
     # Mouse / hover events for the buttons
     def editorEvent(self, event, model, option, index: QModelIndex):
-        key = (index.row(), index.column())
-        if key not in self._rects:
-            return False
+        etype = event.type()
+        if etype not in self._HANDLED_EVENTS:
+            return super().editorEvent(event, model, option, index)
 
-        rmap = self._rects[key]
+        geom = self._button_geometry(option.rect)
         pos = event.pos()
-        etype = event.type()
 
         # Hover handling
         if etype == QEvent.MouseMove:
-            new_hover: Optional[tuple[int, str]] = None
             # Check which, if any, button contains the mouse position.
-            for btn_key, r in rmap.items():
-                if r.contains(pos):
-                    new_hover = (index.row(), btn_key)
-                    break
-
-            # Only update if hover target changed > prevents unnecessary repaints.
-            if new_hover != self._hovered:
-                self._hovered = new_hover
-                if self.parent():
-                    # Request a repaint of the table's visible area.
-                    self.parent().viewport().update()
+            btn_key = self._hit_test(geom, pos)
+            hovered = self._hovered
+
+            # Only update if hover target changed > prevents unnecessary repaints. The common
+            # case of moving within the same button (or over no button) returns right away.
+            if hovered is None:
+                if btn_key is None:
+                    return False
+            elif btn_key == hovered[1] and hovered[0] == index.row():
+                return False
+
+            # Request a (throttled) repaint of the previously and newly hovered cells.
+            if hovered is not None:
+                self._schedule_hover_update((hovered[0], index.column()))
+            self._hovered = (index.row(), btn_key) if btn_key else None
+            self._schedule_hover_update((index.row(), index.column()))
             return False
 
         if etype == QEvent.Leave:
             # Mouse left the cell: clear hover.
             if self._hovered is not None:
+                self._schedule_hover_update((self._hovered[0], index.column()))
                 self._hovered = None
-                if self.parent():
-                    self.parent().viewport().update()
             return False
 
         # Click handling
@@ -124,11 +228,7 @@ class SAActionButtonDelegate(QStyledItemDelegate):
             source_row = source_index.row()
 
             # Determine which button was clicked at that coordinate.
-            clicked: Optional[str] = None
-            for btn_key, r in rmap.items():
-                if r.contains(pos):
-                    clicked = btn_key
-                    break
+            clicked = self._hit_test(geom, pos)
 
             if clicked:
                 QApplication.beep()
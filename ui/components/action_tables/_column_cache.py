@@ -0,0 +1,77 @@
+from __future__ import annotations
+import sys
+from typing import Dict, List
+
+"""
+This module holds the per-column caches shared by the Equipment, Inventory and Service Activity
+table models. The filter proxies and the "Filters & Columns" windows read whole columns at a time:
+the text of every row, the sorted distinct values, and which rows hold each value. Each of these is
+built on first use and kept until the model's items change, so filtering and reopening a filter
+window read lists instead of calling getattr() and str() on every row object again.
+
+ui.components.action_tables._column_cache.py index:
+
+class ColumnCacheMixin(): Cached per-column text, distinct values and rows per value
+ - def _reset_column_caches(): Drops every cached column and bumps data_version
+ - def column_text(): Text of one column for every row, cached until the items change
+ - def unique_values(): Sorted distinct values of one column, cached until the items change
+ - def value_rows(): Rows holding each value of one column, cached until the items change
+"""
+
+class ColumnCacheMixin:
+    # Mixed into table models that keep their row objects in 'items' and a 'data_version'
+    # counter. Models with a display cache ('_display_rows', the cell text of every row) map
+    # item fields to display columns in '_field_cols', so column_text() reuses that text.
+    _field_cols: Dict[str, int] = {}
+
+    def _reset_column_caches(self):
+        # The items changed, so every cached column belongs to the old ones. data_version is
+        # bumped so caches built from them elsewhere (the filter proxy's row mask, the Filters
+        # & Columns window) can tell they are out of date.
+        # Text per column key (one list per column, indexed by row)
+        self._col_cache: Dict[str, List[str]] = {}
+        # Sorted distinct values per column key, for the filter window
+        self._unique_cache: Dict[str, List[str]] = {}
+        # Row numbers per distinct value, per column key
+        self._rows_cache: Dict[str, Dict[str, List[int]]] = {}
+        self.data_version += 1
+
+    def column_text(self, key: str) -> List[str]:
+        # Returns the text of column 'key' for every row ("" for None or missing attributes),
+        # built on first use and kept until the items change, so filtering reads a list
+        # instead of calling getattr() and str() per row. Displayed columns reuse the text
+        # already in the display cache.
+        texts = self._col_cache.get(key)
+        if texts is None:
+            col = self._field_cols.get(key)
+            if col is not None:
+                texts = [sys.intern(row[col]) for row in self._display_rows]
+            else:
+                texts = [
+                    sys.intern("" if (val := getattr(item, key, None)) is None else str(val))
+                    for item in self.items
+                ]
+            self._col_cache[key] = texts
+        return texts
+
+    def unique_values(self, key: str) -> List[str]:
+        # Returns the sorted distinct values of column 'key', as offered by the filter window.
+        # Computed once per column until the items change, so reopening the filter window does
+        # not rescan the whole table.
+        values = self._unique_cache.get(key)
+        if values is None:
+            values = sorted(set(self.column_text(key)))
+            self._unique_cache[key] = values
+        return values
+
+    def value_rows(self, key: str) -> Dict[str, List[int]]:
+        # Returns, for each distinct value of column 'key', the rows holding it. Built once per
+        # column until the items change, so the column filter popup can combine filters by
+        # value instead of re-filtering every row.
+        rows_by_value = self._rows_cache.get(key)
+        if rows_by_value is None:
+            rows_by_value = {}
+            for row, text in enumerate(self.column_text(key)):
+                rows_by_value.setdefault(text, []).append(row)
+            self._rows_cache[key] = rows_by_value
+        return rows_by_value
@@ -1,7 +1,10 @@
 from __future__ import annotations
+from operator import attrgetter
 from typing import List, Dict
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from core.models.equipment_model import EquipmentInfo
+from ui.components.action_tables._column_cache import ColumnCacheMixin
+from ui.components.base_tables.base_table_model import replace_items
 
 """
 This module defines the EquipmentInfoTableModel, a Qt table model that transforms a list of 
@@ -15,27 +18,69 @@ ui.components.action_tables.equipment_table.py index:
 
 class EquipmentInfoTableModel(): Converts a list of EquipmentInfo objects into a drawable format
  - def __init__(): Store items, columns, labels.
+ - def _display_row(): Builds the display text for every cell of one row
  - def rowCount(): Number of rows = number of items
  - def columnCount(): Number of columns defined in self.columns
  - def headerData(): Human-readable names for the table headers
  - def flags(): Flags define how cells behave (selectable? editable?)
  - def data(): Cell content returned here
  - def set_items(): Replaces entire dataset and refreshes the table
+ - def _apply_items(): Stores the new items and rebuilds the display cache
 """
 
 # Equipment Info table model: converts a list of EquipmentInfo objects into a format that
 # QTableView can draw. Every column corresponds to a field like "area", "customer",
 # "serial number", etc.
-class EquipmentInfoTableModel(QAbstractTableModel):
+class EquipmentInfoTableModel(ColumnCacheMixin, QAbstractTableModel):
+    # Every cell (actions included) is enabled, selectable and read-only
+    _FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
     def __init__(self, items: List[EquipmentInfo], columns: List[str], column_labels: Dict[str, str]):
         super().__init__()
         self.items = items
+        # Rows reported to the view; replace_items() moves it in step with row inserts/removals
+        self._visible_rows = len(items)
         self.columns = columns
         self.column_labels = column_labels
 
+        # Header text per section, resolved once from the label mapping
+        self._header_labels = [self.column_labels.get(key, key) for key in self.columns]
+        # Alignment only depends on the column: actions centered, others left-aligned
+        self._alignments = [
+            Qt.AlignCenter if key == "actions" else Qt.AlignLeft | Qt.AlignVCenter
+            for key in self.columns
+        ]
+        # Item fields shown in the table (everything but actions), pulled out of each item in a
+        # single C-level attrgetter call when the display cache is built
+        self._field_keys = [key for key in self.columns if key != "actions"]
+        self._actions_cols = [col for col, key in enumerate(self.columns) if key == "actions"]
+        if len(self._field_keys) > 1:
+            self._get_fields = attrgetter(*self._field_keys)
+        else:
+            self._get_fields = lambda item, keys=tuple(self._field_keys): tuple(getattr(item, k) for k in keys)
+        # Display-row position of each item field, so column_text() can reuse the display text
+        self._field_cols = {key: col for col, key in enumerate(self.columns) if key != "actions"}
+        # Bumped whenever the items change, so things built from them elsewhere (the Filters &
+        # Columns window) can tell they are out of date
+        self.data_version = 0
+        self._apply_items(items)
+
+    # Builds the text shown in every cell of one row, so data() never touches the item
+    def _display_row(self, item: EquipmentInfo) -> List[str]:
+        try:
+            values = self._get_fields(item)
+        except AttributeError:
+            # Item is missing one of the fields; fall back to a per-field lookup with defaults
+            values = tuple(getattr(item, key, "") for key in self._field_keys)
+        row = ["" if val is None else str(val) for val in values]
+        # Actions column only shows placeholder text
+        for col in self._actions_cols:
+            row.insert(col, "Edit | Delete")
+        return row
+
     # Number of rows = number of items
     def rowCount(self, parent=QModelIndex()) -> int:
-        return len(self.items)
+        return self._visible_rows
 
     # Number of columns defined in self.columns
     def columnCount(self, parent=QModelIndex()) -> int:
@@ -44,46 +89,41 @@ class EquipmentInfoTableModel(QAbstractTableModel):
     # Human-readable names for the table headers
     def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.DisplayRole):
         if role == Qt.DisplayRole and orientation == Qt.Horizontal:
-            key = self.columns[section]
-            return self.column_labels.get(key, key)
+            return self._header_labels[section]
         return super().headerData(section, orientation, role)
 
     # Flags define how cells behave (selectable? editable?)
     def flags(self, index: QModelIndex):
         if not index.isValid():
             return Qt.ItemIsEnabled
-        key = self.columns[index.column()]
-        # The "actions" column is not editable — delegate handles it.
-        if key == "actions":
-            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
-        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        # No cell is editable; the "actions" column is handled by its delegate.
+        return self._FLAGS
 
-    # Cell content returned here
+    # Cell content returned here. Only display text and alignment are answered; every
+    # other role Qt asks about (tooltip, font, size hint, ...) returns None straight away.
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
-        if not index.isValid():
-            return None
-
-        item = self.items[index.row()]
-        key = self.columns[index.column()]
-
-        # What shows inside cells
         if role == Qt.DisplayRole:
-            # Actions column only shows placeholder text
-            if key == "actions":
-                return "Edit | Delete"
-            val = getattr(item, key, "")
-            return "" if val is None else str(val)
-
-        # Align actions column centered; others left-aligned
-        if role == Qt.TextAlignmentRole:
-            if key == "actions":
-                return Qt.AlignCenter
-            return Qt.AlignLeft | Qt.AlignVCenter
-
-        return None
+            # What shows inside cells (precomputed in set_items)
+            if not index.isValid():
+                return None
+            return self._display_rows[index.row()][index.column()]
+        elif role == Qt.TextAlignmentRole:
+            # Align actions column centered; others left-aligned
+            if not index.isValid():
+                return None
+            return self._alignments[index.column()]
+        else:
+            return None
 
-    # Replaces entire dataset and refreshes the table
+    # Replaces entire dataset and refreshes the table. Rather than a full model reset, only the
+    # difference in row count is inserted/removed and the remaining rows are marked as changed,
+    # so the view keeps its selection, scroll position and header state across reloads.
     def set_items(self, items: List[EquipmentInfo]):
-        self.beginResetModel()
+        replace_items(self, self.items, items)
+
+    # Stores the new items and rebuilds the per-row display cache; the per-column caches
+    # belong to the old items and are dropped
+    def _apply_items(self, items: List[EquipmentInfo]):
         self.items = items
-        self.endResetModel()
\ No newline at end of file
+        self._display_rows = [self._display_row(item) for item in items]
+        self._reset_column_caches()
@@ -1,7 +1,10 @@
 from __future__ import annotations
+from operator import attrgetter
 from typing import List, Dict, Any
 from PySide6.QtCore import (Qt, QAbstractTableModel, QModelIndex)
 from PySide6.QtGui import QBrush, QColor
+from ui.components.action_tables._column_cache import ColumnCacheMixin
+from ui.components.base_tables.base_table_model import replace_items
 
 """
 This module defines the InventoryTableModel, a Qt table model that converts a list of InventoryItem 
@@ -16,29 +19,104 @@ ui.components.action_tables.inventory_table.py index:
 
 class InventoryTableModel(): Converts a list of Inventory objects into a drawable format
  - def __init__(): Initialize items and column metadata.
+ - def _display_row(): Builds the display text for every cell of one row
+ - def _classify_description(): Maps a part description to highlight color codes
  - def rowCount(): Number of rows = number of items
  - def columnCount(): Number of columns defined in self.columns
  - def headerData(): Human-readable names for the table headers
  - def flags(): Flags define how cells behave (selectable? editable?)
  - def data(): Cell content returned here
  - def set_items(): Replaces entire dataset and refreshes the table
+ - def _apply_items(): Stores the new items and rebuilds the row caches
 """
 
 # Inventory table model: converts a list of Inventory objects into a format that
 # QTableView can draw. Every column corresponds to a field like "model", "part number", etc.
-class InventoryTableModel(QAbstractTableModel):
+class InventoryTableModel(ColumnCacheMixin, QAbstractTableModel):
+    # Constant brushes shared by every cell; built once instead of on each data() call
+    _BRUSH_WHITE = QBrush(Qt.white)
+    _BRUSH_DARKCYAN = QBrush(Qt.darkCyan)
+
+    # Part description highlight brushes, indexed by color code:
+    # 0 = no color keyword, 1 = black, 2 = yellow, 3 = cyan, 4 = magenta
+    _BG_BRUSHES = (
+        QBrush(Qt.transparent),
+        QBrush(Qt.darkGray),
+        QBrush(QColor("#fff799")),
+        QBrush(QColor("#b5ffff")),
+        QBrush(QColor("#ffb5ff")),
+    )
+    _FG_BRUSHES = (None, _BRUSH_WHITE, QBrush(Qt.black), QBrush(Qt.black), QBrush(Qt.black))
+
+    # Every cell (actions included) is enabled, selectable and read-only
+    _FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
     def __init__(self, items: List[Any], all_columns: List[str], column_labels: Dict[str, str]):
         super().__init__()
         # items = list of InventoryItem objects coming from the database
         self.items = items
+        # Rows reported to the view; replace_items() moves it in step with row inserts/removals
+        self._visible_rows = len(items)
         # all_columns = list of internal field names (keys used to access item attributes)
         self.all_columns = all_columns
         # column_labels = mapping of internal field name -> human-readable column header
         self.column_labels = column_labels
 
+        # Per-column flags for the specially colored columns, so cell methods skip string compares
+        self._is_actions = [key == "actions" for key in self.all_columns]
+        self._is_description = [key == "part_description" for key in self.all_columns]
+        # Header text per section, resolved once from the label mapping
+        self._header_labels = [self.column_labels.get(key, key) for key in self.all_columns]
+        # Alignment only depends on the column, so resolve it once
+        self._alignments = [
+            Qt.AlignCenter if key == "actions" else Qt.AlignLeft | Qt.AlignVCenter
+            for key in self.all_columns
+        ]
+        # Item fields shown in the table (everything but actions), pulled out of each item in a
+        # single C-level attrgetter call when the display cache is built
+        self._field_keys = [key for key in self.all_columns if key != "actions"]
+        self._actions_cols = [col for col, key in enumerate(self.all_columns) if key == "actions"]
+        if len(self._field_keys) > 1:
+            self._get_fields = attrgetter(*self._field_keys)
+        else:
+            self._get_fields = lambda item, keys=tuple(self._field_keys): tuple(getattr(item, k) for k in keys)
+        # Display-row position of each item field, so column_text() can reuse the display text
+        self._field_cols = {key: col for col, key in enumerate(self.all_columns) if key != "actions"}
+        # Where the description sits in a display row, so its color can be read from the text
+        self._desc_col = self.all_columns.index("part_description") if "part_description" in self.all_columns else None
+        # Bumped whenever the items change, so caches built from them elsewhere (the filter
+        # proxy's row mask) can tell they are out of date
+        self.data_version = 0
+        # Display text per row/column and (background, foreground) color codes per row for the
+        # Description column, rebuilt whenever the items change
+        self._apply_items(items)
+
+    def _display_row(self, item: Any) -> List[str]:
+        # Builds the text shown in every cell of one row, so data() never touches the item.
+        try:
+            values = self._get_fields(item)
+        except AttributeError:
+            # Item is missing one of the fields; fall back to a per-field lookup with defaults
+            values = tuple(getattr(item, key, "") for key in self._field_keys)
+        row = ["" if val is None else str(val) for val in values]
+        # Actions column only shows placeholder text
+        for col in self._actions_cols:
+            row.insert(col, "Order | Edit | Delete")
+        return row
+
+    @staticmethod
+    def _classify_description(desc: str) -> tuple[int, int]:
+        # Scans the description for color words once, returning (background, foreground) codes.
+        # "black" wins for the background, but any light color forces black text.
+        desc = desc.lower()
+        light = 2 if "yellow" in desc else 3 if "cyan" in desc else 4 if "magenta" in desc else 0
+        if "black" in desc:
+            return 1, light or 1
+        return light, light
+
     def rowCount(self, parent=QModelIndex()) -> int:
         # How many rows to show
-        return len(self.items)
+        return self._visible_rows
 
     def columnCount(self, parent=QModelIndex()) -> int:
         # How many columns to show
@@ -47,85 +125,83 @@ class InventoryTableModel(QAbstractTableModel):
     def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.DisplayRole):
         # This defines what text appears in the table header row (column names)
         if role == Qt.DisplayRole and orientation == Qt.Horizontal:
-            key = self.all_columns[section]
-            return self.column_labels.get(key, key)
+            return self._header_labels[section]
         return super().headerData(section, orientation, role)
 
     def flags(self, index: QModelIndex):
         # Flags describe what the cell can do (selectable, editable, etc.)
         if not index.isValid():
             return Qt.ItemIsEnabled
-        key = self.all_columns[index.column()]
-
-        if key == "actions":
-            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
-        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return self._FLAGS
 
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
     # What text to show in each cell (DisplayRole), how to align the text (TextAlignmentRole),
-    # whether to change background/foreground colors (BackgroundRole/ForegroundRole)
-        if not index.isValid():
+    # whether to change background/foreground colors (BackgroundRole/ForegroundRole). Any other
+    # role returns None before touching the row data.
+        if role == Qt.DisplayRole:
+            # Display text in the cell (precomputed in set_items)
+            if not index.isValid():
+                return None
+            return self._display_rows[index.row()][index.column()]
+
+        elif role == Qt.TextAlignmentRole:
+            # Text alignment
+            if not index.isValid():
+                return None
+            return self._alignments[index.column()]
+
+        elif role == Qt.BackgroundRole:
+            if not index.isValid():
+                return None
+            col = index.column()
+            # Actions column color
+            if self._is_actions[col]:
+                return self._BRUSH_DARKCYAN
+            # Color-coding of part description background; the description text is scanned for
+            # color words like "black", "yellow", "cyan", "magenta" in set_items, and the
+            # Description column is lightly colored so those items stand out (transparent if
+            # none were found).
+            if self._is_description[col]:
+                return self._BG_BRUSHES[self._desc_colors[index.row()][0]]
             return None
 
-        item = self.items[index.row()]
-        key = self.all_columns[index.column()]
+        elif role == Qt.ForegroundRole:
+            if not index.isValid():
+                return None
+            col = index.column()
+            # Actions column text
+            if self._is_actions[col]:
+                return self._BRUSH_WHITE
+            # Make sure text is always readable over the chosen background colors: black text
+            # on light backgrounds (yellow, cyan, magenta), white text on the dark "black" one.
+            if self._is_description[col]:
+                return self._FG_BRUSHES[self._desc_colors[index.row()][1]]
+            return None
 
-        # Display text in the cell
-        if role == Qt.DisplayRole:
-            if key == "actions":
-                return "Order | Edit | Delete"
-            val = getattr(item, key, "")
-            return "" if val is None else str(val)
-
-        # Text alignment
-        if role == Qt.TextAlignmentRole:
-            if key == "actions":
-                return Qt.AlignCenter
-            return Qt.AlignLeft | Qt.AlignVCenter
-
-        # Actions column colors
-        if role == Qt.ForegroundRole and key == "actions":
-            return QBrush(Qt.white)
-        if role == Qt.BackgroundRole and key == "actions":
-            return QBrush(Qt.darkCyan)
-
-        # Color-coding ot part description background; to use the description text to detect
-        # color words like "black", "yellow", "cyan", "magenta" and lightly color the background
-        # of the Description column so those items stand out.
-        if role == Qt.BackgroundRole and key == "part_description":
-            desc = str(getattr(item, "part_description", "")).lower()
-            # If the text contains certain color names, use a matching background color.
-            if "black" in desc:
-                # Dark gray background for "black" items.
-                return QBrush(Qt.darkGray)
-            elif "yellow" in desc:
-                # Light yellow background to stay readable.
-                return QBrush(QColor("#fff799"))
-            elif "cyan" in desc:
-                # Soft cyan background.
-                return QBrush(QColor("#b5ffff"))
-            elif "magenta" in desc:
-                # Soft magenta background.
-                return QBrush(QColor("#ffb5ff"))
-            # If no color keyword was found, keep the default table background.
-            return QBrush(Qt.transparent)
-
-        # Make sure text is always readable over the chosen background colors.
-        if role == Qt.ForegroundRole and key == "part_description":
-            desc = str(getattr(item, "part_description", "")).lower()
-
-            # On light backgrounds (yellow, cyan, magenta), use black text.
-            if any(color in desc for color in ("yellow", "cyan", "magenta")):
-                return QBrush(Qt.black)
-
-            # On dark background (for "black"), white text.
-            if "black" in desc:
-                return QBrush(Qt.white)
+        else:
             return None
-        return None
 
     def set_items(self, items: List[Any]):
-        # When the underlying data list changes, notify Qt to fully refresh the table.
-        self.beginResetModel()
+        # When the underlying data list changes, notify Qt of just what changed: the row-count
+        # difference is inserted/removed and the remaining rows are marked as changed. This avoids
+        # a full model reset, so the view keeps its selection and scroll position across reloads.
+        replace_items(self, self.items, items)
+
+    def _apply_items(self, items: List[Any]):
+        # Stores the new items and rebuilds the per-row display and color caches in one pass;
+        # the color scan reuses the description text already produced for the display row.
+        desc_col = self._desc_col
+        display_rows = []
+        desc_colors = []
+        for item in items:
+            row = self._display_row(item)
+            display_rows.append(row)
+            if desc_col is not None:
+                desc = row[desc_col]
+            else:
+                desc = str(getattr(item, "part_description", ""))
+            desc_colors.append(self._classify_description(desc))
         self.items = items
-        self.endResetModel()
\ No newline at end of file
+        self._display_rows = display_rows
+        self._desc_colors = desc_colors
+        self._reset_column_caches()
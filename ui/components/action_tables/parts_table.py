@@ -1,7 +1,9 @@
+from operator import attrgetter
 from typing import List, Dict
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QColor
 from core.models.parts_model import PartsOrder
+from ui.components.base_tables.base_table_model import replace_items
 
 """
 This module defines the PartsTableModel, a Qt table model that adapts a list of PartsOrder objects 
@@ -15,26 +17,70 @@ ui.components.action_tables.parts_table.py index:
 
 class PartsTableModel(): Converts a list of Parts objects into a drawable format
  - def __init__(): Store items, columns, labels.
+ - def _display_row(): Builds the display text for every cell of one row
  - def rowCount(): Number of rows = number of items
  - def columnCount(): Number of columns defined in self.columns
  - def headerData(): Human-readable names for the table headers
  - def flags(): Flags define how cells behave (selectable? editable?)
  - def data(): Cell content returned here
  - def set_items(): Replaces entire dataset and refreshes the table
+ - def _apply_items(): Stores the new items and rebuilds the display cache
+ - def lower_column_text(): Lowercased display text of one column, for the filter proxy
 
 """
 
 # Table model for supplying row and column data to the table.
 class PartsTableModel(QAbstractTableModel):
+    # Text color for the actions column, built once instead of on each data() call
+    _ACTIONS_FG = QColor("#ffffff")
+    # Every cell (actions included) is enabled, selectable and read-only
+    _FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
     def __init__(self, items: List[PartsOrder], columns: List[str], column_labels: Dict[str, str]):
         super().__init__()
         self.items = items
+        # Rows reported to the view; replace_items() moves it in step with row inserts/removals
+        self._visible_rows = len(items)
         self.columns = columns
         self.column_labels = column_labels
 
+        # Per-column "is this the actions column" flags, so cell methods skip string compares
+        self._is_actions = [key == "actions" for key in self.columns]
+        # Header text per section, resolved once from the label mapping
+        self._header_labels = [self.column_labels.get(key, key) for key in self.columns]
+        # Alignment only depends on the column, so resolve it once
+        self._alignments = [
+            Qt.AlignCenter if key in ("id", "quantity", "actions") else Qt.AlignLeft | Qt.AlignVCenter
+            for key in self.columns
+        ]
+        # Item fields shown in the table (everything but actions), pulled out of each item in a
+        # single C-level attrgetter call when the display cache is built
+        self._field_keys = [key for key in self.columns if key != "actions"]
+        self._actions_cols = [col for col, key in enumerate(self.columns) if key == "actions"]
+        if len(self._field_keys) > 1:
+            self._get_fields = attrgetter(*self._field_keys)
+        else:
+            self._get_fields = lambda item, keys=tuple(self._field_keys): tuple(getattr(item, k) for k in keys)
+        self._display_rows = [self._display_row(item) for item in items]
+        # Lowercased display text per column index, built on first use by a filter
+        self._lower_cache: Dict[int, List[str]] = {}
+
+    def _display_row(self, item: PartsOrder) -> List[str]:
+        # Builds the text shown in every cell of one row, so data() never touches the item.
+        try:
+            values = self._get_fields(item)
+        except AttributeError:
+            # Item is missing one of the fields; fall back to a per-field lookup with defaults
+            values = tuple(getattr(item, key, "") for key in self._field_keys)
+        row = ["" if val is None else str(val) for val in values]
+        # Actions column only shows placeholder text
+        for col in self._actions_cols:
+            row.insert(col, "Edit | Delete")
+        return row
+
     def rowCount(self, parent=QModelIndex()) -> int:
         # Returns the number of rows in the table.
-        return len(self.items)
+        return self._visible_rows
 
     def columnCount(self, parent=QModelIndex()) -> int:
         # Returns the number of columns.
@@ -43,52 +89,53 @@ class PartsTableModel(QAbstractTableModel):
     def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.DisplayRole):
         # Provides the text shown in the table header.
         if role == Qt.DisplayRole and orientation == Qt.Horizontal:
-            key = self.columns[section]
-            return self.column_labels.get(key, key)
+            return self._header_labels[section]
         return super().headerData(section, orientation, role)
 
     def flags(self, index: QModelIndex):
         # Defines selection behavior and disables in-table editing.
         if not index.isValid():
             return Qt.ItemIsEnabled
-
-        key = self.columns[index.column()]
-        if key == "actions":
-            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
-
-        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return self._FLAGS
 
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
         # Returns the display value for each cell, using a placeholder for actions.
-        if not index.isValid():
-            return None
-
-        item = self.items[index.row()]
-        key = self.columns[index.column()]
-
-        # What text appears in each cell
+        # Only display text, alignment and the actions text color are answered; any other
+        # role returns None before touching the row data.
         if role == Qt.DisplayRole:
-            if key == "actions":
-                return "Edit | Delete"
-            val = getattr(item, key, "")
-            return "" if val is None else str(val)
-
-        # Center numeric-like cells
-        if role == Qt.TextAlignmentRole:
-            if key in ("id", "quantity"):
-                return Qt.AlignCenter
-            if key == "actions":
-                return Qt.AlignCenter
-            return Qt.AlignLeft | Qt.AlignVCenter
-
-        # Make text white for actions column
-        if role == Qt.ForegroundRole and key == "actions":
-            return QColor("#ffffff")
-
-        return None
+            # What text appears in each cell (precomputed in set_items)
+            if not index.isValid():
+                return None
+            return self._display_rows[index.row()][index.column()]
+        elif role == Qt.TextAlignmentRole:
+            # Center numeric-like cells and the actions column
+            if not index.isValid():
+                return None
+            return self._alignments[index.column()]
+        elif role == Qt.ForegroundRole:
+            # Make text white for actions column
+            if index.isValid() and self._is_actions[index.column()]:
+                return self._ACTIONS_FG
+            return None
+        else:
+            return None
 
     def set_items(self, items: List[PartsOrder]):
-        # Replaces the internal data and refreshes the table.
-        self.beginResetModel()
+        # Replaces the internal data and refreshes the table. Instead of a full model reset,
+        # only the row-count difference is inserted/removed and the remaining rows are marked
+        # as changed, so the view keeps its selection and scroll position across reloads.
+        replace_items(self, self.items, items)
+
+    def _apply_items(self, items: List[PartsOrder]):
+        # Stores the new items and rebuilds the per-row display cache.
         self.items = items
-        self.endResetModel()
\ No newline at end of file
+        self._display_rows = [self._display_row(item) for item in items]
+        self._lower_cache = {}
+
+    def lower_column_text(self, col: int) -> List[str]:
+        # Returns the lowercased display text of column 'col' for every row, taken from the
+        # display cache once per dataset, so substring filters compare without lowering cells.
+        texts = self._lower_cache.get(col)
+        if texts is None:
+            texts = self._lower_cache[col] = [row[col].lower() for row in self._display_rows]
+        return texts
\ No newline at end of file
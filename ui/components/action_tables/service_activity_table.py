@@ -1,8 +1,10 @@
 from __future__ import annotations
+import sys
 from typing import List, Dict
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
-from PySide6.QtGui import QBrush, QColor
 from core.models.service_activity_model import ServiceActivity
+from ui.components.action_tables._column_cache import ColumnCacheMixin
+from ui.components.base_tables.base_table_model import replace_items
 
 """
 This module defines the ServiceActivityTableModel, a Qt table model that converts a list of 
@@ -23,10 +25,16 @@ class ServiceActivityTableModel(): Converts a list of Service Activity objects i
  - def flags(): Flags define how cells behave (selectable? editable?)
  - def data(): Cell content returned here
  - def set_items(): Replaces entire dataset and refreshes the table
+ - def _apply_items(): Stores the new items and drops the per-column text cache
+ - def setData(): Writes an edited cell back to its ServiceActivity
 """
 
+# Alignment flags, combined once instead of per data() call.
+_ALIGN_LEFT_V = Qt.AlignLeft | Qt.AlignVCenter
+_ALIGN_CENTER = Qt.AlignCenter
+
 # Table model that supplies data and formatting for the service activity table.
-class ServiceActivityTableModel(QAbstractTableModel):
+class ServiceActivityTableModel(ColumnCacheMixin, QAbstractTableModel):
     # Defines the table’s rows, columns, and display behavior without handling filters or buttons.
     def __init__(
         self,
@@ -37,16 +45,33 @@ class ServiceActivityTableModel(QAbstractTableModel):
         super().__init__()
         # List of ServiceActivity objects to show in the table.
         self.items = items
+        # Rows reported to the view; replace_items() moves it in step with row inserts/removals
+        self._visible_rows = len(items)
         # List of column keys (attributes on ServiceActivity, e.g., "customer").
         self.all_columns = all_columns
         # Human-readable labels for each column key.
         self.column_labels = column_labels
+        # Resolved header text per column, so header repaints are a single list index.
+        self._header_labels = [column_labels.get(key, key) for key in all_columns]
+        # Column keys by index, plus the special columns resolved to indexes (-1 if absent),
+        # so data() and flags() compare integers instead of strings. Keys are interned so the
+        # per-cell getattr() matches attribute names by identity.
+        self._cols = tuple(sys.intern(key) for key in all_columns)
+        self._actions_col = all_columns.index("actions") if "actions" in all_columns else -1
+        self._part_replaced_col = (
+            all_columns.index("part_replaced") if "part_replaced" in all_columns else -1
+        )
+        # Bumped whenever the items or any cell change, so caches built from them elsewhere
+        # (the filter proxy's row mask) can tell they are out of date
+        self.data_version = 0
+        # Per-column text / distinct values / rows per value (ColumnCacheMixin), built lazily
+        self._reset_column_caches()
 
     # --- Required overrides so Qt knows the table's structure ----------------
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         # How many rows are in the table? One row per ServiceActivity item.
-        return len(self.items)
+        return self._visible_rows
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         # How many columns? One column per entry in all_columns.
@@ -60,21 +85,20 @@ class ServiceActivityTableModel(QAbstractTableModel):
     ):
         # Returns the display text for column headers.
         if role == Qt.DisplayRole and orientation == Qt.Horizontal:
-            key = self.all_columns[section]
-            # Return human-readable label, refer to the raw key if missing.
-            return self.column_labels.get(key, key)
+            # Human-readable label (or the raw key if missing), resolved in __init__.
+            return self._header_labels[section]
         return super().headerData(section, orientation, role)
 
     def flags(self, index):
         if not index.isValid():
             return Qt.ItemIsEnabled
 
-        key = self.all_columns[index.column()]
+        col = index.column()
 
-        if key == "actions":
+        if col == self._actions_col:
             return Qt.ItemIsEnabled | Qt.ItemIsSelectable
 
-        if key == "part_replaced":
+        if col == self._part_replaced_col:
             # Defines which cells are editable or selectable.
             return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
 
@@ -85,48 +109,45 @@ class ServiceActivityTableModel(QAbstractTableModel):
         if not index.isValid():
             return None
 
-        # Which ServiceActivity object is this row representing?
-        item = self.items[index.row()]
         # Which field (column) is being displayed?
-        key = self.all_columns[index.column()]
+        col = index.column()
+        is_actions = col == self._actions_col
 
         # Text to display in the cell
         if role == Qt.DisplayRole:
-            if key == "actions":
+            if is_actions:
                 # Placeholder text-- the visual "buttons" are drawn by the delegate, but the table still
                 # expects some string.
                 return "Edit | Delete"
 
-            # For any other column, read the attribute from the ServiceActivity object.
-            val = getattr(item, key, "")
+            # For any other column, read the attribute from the ServiceActivity object
+            # this row represents.
+            val = getattr(self.items[index.row()], self._cols[col], "")
             return "" if val is None else str(val)
 
         # Text alignment
         if role == Qt.TextAlignmentRole:
-            if key == "actions":
+            if is_actions:
                 # Center-align the "Edit / Delete" text in the actions column so the buttons are centered.
-                return Qt.AlignCenter
+                return _ALIGN_CENTER
             # All other cells: left-aligned, vertically centered.
-            return Qt.AlignLeft | Qt.AlignVCenter
+            return _ALIGN_LEFT_V
 
-        # Colors for the Actions column
-        if role == Qt.ForegroundRole and key == "actions":
-            # White placeholder text.
-            return QBrush(Qt.white)
-
-        if role == Qt.BackgroundRole and key == "actions":
-            # Slightly tinted background to visually separate this column.
-            return QBrush(QColor("#204050"))
-
-        # For all other cases, do nothing special.
+        # For all other cases, do nothing special. (The Actions column colors are applied by
+        # SAActionButtonDelegate, which owns that column's painting.)
         return None
 
-    # Helper to reset all data at once
+    # Helper to replace all data at once
     def set_items(self, items: List[ServiceActivity]):
-        # Replaces all items and refreshes the table.
-        self.beginResetModel()
+        # Replaces all items and refreshes the table. Instead of a full model reset, only the
+        # row-count difference is inserted/removed and the remaining rows are marked as
+        # changed, so the view keeps its selection and scroll position across reloads.
+        replace_items(self, self.items, items)
+
+    def _apply_items(self, items: List[ServiceActivity]):
+        # Stores the new items; cached column text and unique values belong to the old ones.
         self.items = items
-        self.endResetModel()
+        self._reset_column_caches()
 
     def setData(self, index, value, role=Qt.EditRole):
         if not index.isValid():
@@ -138,10 +159,18 @@ class ServiceActivityTableModel(QAbstractTableModel):
         row = index.row()
         col = index.column()
 
-        key = self.all_columns[col]
+        key = self._cols[col]
 
         # Update the underlying ServiceActivity instance
         setattr(self.items[row], key, value)
+        # Keep the cached column text (if that column was cached) in step with the edit
+        texts = self._col_cache.get(key)
+        if texts is not None:
+            texts[row] = sys.intern("" if value is None else str(value))
+        # The edited column's distinct values (and the rows holding them) may have changed
+        self._unique_cache.pop(key, None)
+        self._rows_cache.pop(key, None)
+        self.data_version += 1
 
         # Notify Qt that data changed
         self.dataChanged.emit(index, index, [Qt.EditRole])
@@ -1,4 +1,7 @@
 from __future__ import annotations
+import logging
+import re
+import sys
 from typing import Any, List, Dict
 from PySide6.QtCore import (QAbstractTableModel, QModelIndex, Qt)
 from PySide6.QtGui import QColor
@@ -15,18 +18,106 @@ a generic foundation that more specialized table models in the application can e
 ui.components.base_tables.base_table_model.py index:
 
 class BaseTableModel(): Generic reusable table model.
+ - def same_row_keys(): True when two item lists hold the same records in their shared rows
+ - def replace_items(): Swaps a table model's items with the fewest row signals that stay correct
  - def __init__(): Store items and column definitions.
- - def rowCount(): Number of rows = number of items
+ - def rowCount(): Number of rows exposed so far (grows through fetchMore)
+ - def canFetchMore(): True while some items have not been exposed to the view yet
+ - def fetchMore(): Exposes the next batch of rows
+ - def set_fetch_in_batches(): Turns batched loading on/off (off exposes every row)
  - def columnCount(): Number of columns defined in self.columns
- - def data(): Cell content returned here
+ - def data(): Cell content returned here, dispatched by role
+ - def _display_data(): DisplayRole handler (cached cell text)
+ - def _alignment_data(): TextAlignmentRole handler
+ - def _background_data(): BackgroundRole handler (row shading + description highlight)
  - def headerData(): Human-readable names for the table headers
  - def get_value(): Extracts a column's value from a row object
  - def set_items(): Replaces entire dataset and refreshes the table
+ - def _apply_items(): Stores the new items and rebuilds the caches
  - def get_item(): Safe accessor for a single row's object
  - def items(): Returns the raw list of row objects
+ - def lower_column_text(): Lowercased display text of one column, for text filters
  - def setData(): Handles editing of table cells
+ - def _build_col_cache(): Precomputes every cell's display text, column by column
+ - def _refresh_row_cache(): Re-reads one row's cached text and highlight after an edit
+ - def _desc_background(): Picks the background for a row's description cell
     """
 
+logger = logging.getLogger(__name__)
+
+# Cell alignment, combined once instead of OR-ing the flags per data() call
+_ALIGN_LEFT_V = Qt.AlignLeft | Qt.AlignVCenter
+
+# Dark-theme alternating row colors, built once instead of per data() call
+_BG_EVEN = QColor("#2f2f2f")
+_BG_ODD = QColor("#3a3a3a")
+
+# Keyword highlights for "part_description", checked in this order (first match wins)
+_DESC_HIGHLIGHTS = (
+    ("black", QColor("#5a5a5a")),      # dark-gray highlight
+    ("yellow", QColor("#fff799")),     # pale yellow
+    ("cyan", QColor("#b5ffff")),       # soft cyan
+    ("magenta", QColor("#ffb5ff")),    # light magenta
+)
+# All highlight keywords in one compiled pattern, so a description is scanned once
+_DESC_RE = re.compile("|".join(keyword for keyword, _ in _DESC_HIGHLIGHTS))
+
+
+def _row_key(item: Any) -> Any:
+    # A row's identity: its database id, or the object itself when it has none (yet).
+    key = getattr(item, "id", None)
+    return item if key is None else key
+
+
+def same_row_keys(old_items: List[Any], new_items: List[Any]) -> bool:
+    # True when every row the two lists share holds the same record, in the same order. Only
+    # then can a reload be reported as rows appended/removed at the end; otherwise (re-sorted
+    # data, a row deleted in the middle) the shared rows would silently become other records.
+    for old, new in zip(old_items, new_items):
+        if _row_key(old) != _row_key(new):
+            return False
+    return True
+
+
+def replace_items(model: QAbstractTableModel, old_items: List[Any], items: List[Any],
+                  batch: int | None = None):
+    # Swaps a table model's items for 'items'. The model reports its row count from
+    # '_visible_rows' and stores new items (rebuilding its caches) in '_apply_items(items)',
+    # which is called exactly once. When the rows both lists share are the same records in
+    # the same order, trailing rows are removed, the shared rows are marked as changed and
+    # new rows are appended, so the view keeps its selection and scroll position; anything
+    # else resets the model. With 'batch', at most that many rows are exposed after a reset,
+    # and a reload keeps the rows the view had already fetched (at least one batch).
+    if not same_row_keys(old_items, items):
+        model.beginResetModel()
+        model._apply_items(items)
+        model._visible_rows = len(items) if batch is None else min(len(items), batch)
+        model.endResetModel()
+        return
+
+    old_n = model._visible_rows
+    new_n = len(items) if batch is None else min(len(items), max(old_n, batch))
+    if new_n < old_n:
+        # Drop the trailing rows first; the rows that stay keep their old contents until
+        # the removal is complete
+        model.beginRemoveRows(QModelIndex(), new_n, old_n - 1)
+        model._visible_rows = new_n
+        model.endRemoveRows()
+
+    # Rows that exist before and after only have their contents change. The new caches
+    # already cover the rows appended below, which stay hidden until they are inserted.
+    model._apply_items(items)
+    shared = min(old_n, new_n)
+    if shared:
+        model.dataChanged.emit(model.index(0, 0), model.index(shared - 1, model.columnCount() - 1))
+
+    if new_n > old_n:
+        # New rows are exposed only once the existing ones are up to date
+        model.beginInsertRows(QModelIndex(), old_n, new_n - 1)
+        model._visible_rows = new_n
+        model.endInsertRows()
+
+
 class BaseTableModel(QAbstractTableModel):
     # Reusable, generic table model for dark-themed apps. Intended use: 'items' is a list of
     # arbitrary Python objects (ORM rows, objects, dict-like, etc), 'columns' is a list of
@@ -36,83 +127,110 @@ class BaseTableModel(QAbstractTableModel):
     # of headers, optional color highlighting for "part_description" (InventoryPage). It is
     # flexible enough to be subclasses, extended, or reused as-is.
 
+    # Rows exposed to the view per batch; the view asks for more (fetchMore) as it scrolls.
+    FETCH_BATCH = 200
+
     def __init__(self, items: List[Any], columns: List[str], column_labels: Dict[str, str]):
         super().__init__()
         self._items: List[Any] = items or []
         self.columns = columns
         self.column_labels = column_labels or {c: c for c in columns}
+        # Whether rows are handed to the view in FETCH_BATCH chunks (see set_fetch_in_batches)
+        self._fetch_in_batches = True
+        # How many of _items are currently exposed as rows (see fetchMore)
+        self._visible_rows = min(len(self._items), self.FETCH_BATCH)
+
+        # Column keys by index (interned, so getattr() hits the attribute dict's identity fast
+        # path), and where (if anywhere) the highlighted description column is
+        self._col_keys = tuple(sys.intern(key) for key in columns)
+        self._desc_col = columns.index("part_description") if "part_description" in columns else -1
+        # Resolved horizontal header text, so header repaints are a single list index
+        self._header_labels = [self.column_labels.get(key, key) for key in columns]
+        # Display text per column (one list of strings per column, indexed by row), so paints
+        # skip get_value() and str() per cell
+        self._col_cache: List[List[str]] = self._build_col_cache(self._items)
+        # Lowercased copies of _col_cache columns, built on first use by a text filter
+        self._lower_cache: Dict[int, List[str]] = {}
+        # Background per row for the description column, so paints skip the keyword scan
+        self._desc_bg: List[QColor] = self._build_desc_bg(self._items)
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
-        # Returns total number of table rows
-        return len(self._items)
+        # Returns the number of rows exposed so far. Large datasets are handed to the view in
+        # FETCH_BATCH chunks, so Qt only builds indexes / queries data for what it has fetched.
+        if parent.isValid():
+            return 0
+        return self._visible_rows
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        # More rows are available while some items have not been exposed yet.
+        return not parent.isValid() and self._visible_rows < len(self._items)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        # Called by the view when it scrolls near the last exposed row; exposes the next batch.
+        if parent.isValid():
+            return
+        start = self._visible_rows
+        end = min(len(self._items), start + self.FETCH_BATCH)
+        if end <= start:
+            return
+        self.beginInsertRows(QModelIndex(), start, end - 1)
+        self._visible_rows = end
+        self.endInsertRows()
+
+    def set_fetch_in_batches(self, enabled: bool):
+        # Batching only suits a view bound straight to this model. A proxy filters and sorts
+        # the rows the model exposes, so behind one every row is exposed up front (and after
+        # each reload); a filter then covers the whole dataset, at the cost of Qt indexing
+        # every row instead of just the fetched batches.
+        self._fetch_in_batches = enabled
+        if not enabled:
+            while self.canFetchMore():
+                self.fetchMore()
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         # Returns number of visible columns
         return len(self.columns)
 
+    # --------------------------- DISPLAY TEXT ---------------------------
+    def _display_data(self, row: int, col: int):
+        # Text of get_value() (which by default uses getattr()), precomputed in set_items
+        return self._col_cache[col][row]
+
+    # ------------------------- TEXT ALIGNMENT --------------------------
+    def _alignment_data(self, row: int, col: int):
+        return _ALIGN_LEFT_V
+
+    # --------------------- BACKGROUND COLORING -------------------------
+    def _background_data(self, row: int, col: int):
+        # Only the "part_description" column gets extra highlight options. If this is
+        # NOT the description column (or there is none), return the standard alternating
+        # row color (dark theme).
+        if col != self._desc_col:
+            return _BG_EVEN if row % 2 == 0 else _BG_ODD
+
+        # Keyword highlight (or base color) precomputed in set_items
+        return self._desc_bg[row]
+
+    # Role -> handler for the roles data() answers; every other role Qt asks about misses the
+    # lookup and returns None immediately.
+    _ROLE_HANDLERS = {
+        Qt.DisplayRole: _display_data,
+        Qt.TextAlignmentRole: _alignment_data,
+        Qt.BackgroundRole: _background_data,
+    }
+
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
         # Core method, handles how cells appear; handles: DisplayRole (text inside cell),
         # TextAlignmentRole (left/center/etc), BackgroundRole (alternate shading + optional
         # color highlight). Very generic by design, subclasses can override get_value() to
         # implement special column logic per-row.
 
-        if not index.isValid():
+        # Unhandled roles (font, tooltip, size hint, ...) make up most queries; one dict
+        # lookup dispatches the handled ones and rejects the rest.
+        handler = self._ROLE_HANDLERS.get(role)
+        if handler is None or not index.isValid():
             return None
-
-        row = index.row()
-        col = index.column()
-
-        # Current item object
-        item = self._items[row]
-
-        # Attribute name for the column
-        key = self.columns[col]
-
-        # --------------------------- DISPLAY TEXT ---------------------------
-        if role == Qt.DisplayRole:
-            # Default behavior:
-            #     Call get_value() which by default uses getattr()
-            return str(self.get_value(item, key))
-
-        # ------------------------- TEXT ALIGNMENT --------------------------
-        if role == Qt.TextAlignmentRole:
-            return Qt.AlignLeft | Qt.AlignVCenter
-
-        # --------------------- BACKGROUND COLORING -------------------------
-        if role == Qt.BackgroundRole:
-
-            # Standard alternating row colors (dark theme)
-            base_color = QColor("#2f2f2f") if row % 2 == 0 else QColor("#3a3a3a")
-
-            # Only the "part_description" column gets extra highlight options.
-            # If this column does not exist, return the base color.
-            try:
-                desc_col = self.columns.index("part_description")
-            except ValueError:
-                return base_color
-
-            # If this is NOT the description column, return the default background.
-            if col != desc_col:
-                return base_color
-
-            # Retrieve description text for color-coding logic
-            desc = str(self.get_value(item, "part_description")).lower()
-
-            # Apply special theme-based color overlays based on keywords
-            if "black" in desc:
-                return QColor("#5a5a5a")      # dark-gray highlight
-            elif "yellow" in desc:
-                return QColor("#fff799")      # pale yellow
-            elif "cyan" in desc:
-                return QColor("#b5ffff")      # soft cyan
-            elif "magenta" in desc:
-                return QColor("#ffb5ff")      # light magenta
-
-            # If no keyword matches, return the normal alternating base color
-            return base_color
-
-        # For any other role, return nothing
-        return None
+        return handler(self, index.row(), index.column())
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
         # Controls the table's header labels. Horizontal headers: show readable column names.
@@ -123,8 +241,7 @@ class BaseTableModel(QAbstractTableModel):
 
         # Horizontal titles (column headers)
         if orientation == Qt.Horizontal:
-            key = self.columns[section]
-            return self.column_labels.get(key, key)
+            return self._header_labels[section]
 
         # Vertical left-side labels (row numbers)
         return section + 1
@@ -140,22 +257,39 @@ class BaseTableModel(QAbstractTableModel):
         return getattr(item, column_key, "") or ""
 
     def set_items(self, items: List[Any]):
-        # Replace the model's rows entirely. This triggers a full model reset (efficient
-        # inside Qt), causing the table to redraw itself automatically.
-        self.beginResetModel()
-        self._items = items or []
-        self.endResetModel()
+        # Replace the model's rows entirely, through replace_items(): only the difference in
+        # exposed rows is inserted/removed, so the view keeps its selection and scroll position
+        # across reloads. Rows the view had already fetched stay exposed (every row when
+        # batching is off).
+        batch = self.FETCH_BATCH if self._fetch_in_batches else None
+        replace_items(self, self._items, items or [], batch)
+
+    def _apply_items(self, items: List[Any]):
+        # Stores the new items and rebuilds the display text and highlight caches.
+        self._items = items
+        self._col_cache = self._build_col_cache(items)
+        self._lower_cache = {}
+        self._desc_bg = self._build_desc_bg(items)
 
     def get_item(self, row: int) -> Any | None:
         # Safe accessor for a single row's object. Returns None if the row is out of bounds.
+        # Rows not yet fetched by the view are still reachable here.
         if 0 <= row < len(self._items):
             return self._items[row]
         return None
 
     def items(self) -> List[Any]:
-        # Returns the raw list of row objects.
+        # Returns the raw list of row objects (all of them, fetched by the view or not).
         return self._items
 
+    def lower_column_text(self, col: int) -> List[str]:
+        # Returns the lowercased display text of every row in column 'col', built once per
+        # dataset so case-insensitive filters don't lower each cell on every pass.
+        texts = self._lower_cache.get(col)
+        if texts is None:
+            texts = self._lower_cache[col] = [text.lower() for text in self._col_cache[col]]
+        return texts
+
     # ----------------------------------------------------------------------
     # ENABLE EDITING SUPPORT
     # ----------------------------------------------------------------------
@@ -174,7 +308,7 @@ class BaseTableModel(QAbstractTableModel):
 
         item = self.get_item(row)
         if item is None:
-            print("DEBUG: setData aborted — row item is None")
+            logger.debug("setData aborted — row item is None")
             return False
 
         key = self.columns[col]
@@ -182,13 +316,52 @@ class BaseTableModel(QAbstractTableModel):
         try:
             # Update the Python object attribute
             setattr(item, key, value)
-            print(f"DEBUG: setData wrote {key} = {value} into row {row}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("setData wrote %s = %r into row %d", key, value, row)
         except Exception as e:
-            print("DEBUG: setData setattr failed:", e)
+            logger.debug("setData setattr failed: %s", e)
             return False
 
+        # Keep the cached display text and description highlight in sync with the edited row
+        self._refresh_row_cache(row, item)
+
         # Notifies views & proxy that data changed
         self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
-        print("DEBUG: setData emitted dataChanged")
 
         return True
+
+    # ----------------------------------------------------------------------
+    # DISPLAY TEXT / DESCRIPTION HIGHLIGHT CACHES
+    # ----------------------------------------------------------------------
+    def _build_col_cache(self, items: List[Any]) -> List[List[str]]:
+        # Runs get_value() once per cell up front, stored column by column.
+        get_value = self.get_value
+        return [[str(get_value(item, key)) for item in items] for key in self._col_keys]
+
+    def _refresh_row_cache(self, row: int, item: Any):
+        # Recomputes one row's cached text and highlight after an edit. Every column is
+        # refreshed, since get_value() overrides may combine several fields.
+        for col, key in enumerate(self._col_keys):
+            self._col_cache[col][row] = str(self.get_value(item, key))
+        for col, texts in self._lower_cache.items():
+            texts[row] = self._col_cache[col][row].lower()
+        if self._desc_col >= 0:
+            self._desc_bg[row] = self._desc_background(row, item)
+
+    def _build_desc_bg(self, items: List[Any]) -> List[QColor]:
+        # One background per row for the description column (empty if there is no such column).
+        if self._desc_col < 0:
+            return []
+        return [self._desc_background(row, item) for row, item in enumerate(items)]
+
+    def _desc_background(self, row: int, item: Any) -> QColor:
+        # Picks the description cell background: the first matching keyword highlight, or the
+        # row's normal alternating base color if no keyword matches.
+        desc = str(self.get_value(item, "part_description")).lower()
+        found = set(_DESC_RE.findall(desc))
+        if found:
+            # Several keywords can appear; the earliest in _DESC_HIGHLIGHTS wins, as before
+            for keyword, color in _DESC_HIGHLIGHTS:
+                if keyword in found:
+                    return color
+        return _BG_EVEN if row % 2 == 0 else _BG_ODD
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from PySide6.QtWidgets import QTableView
+from PySide6.QtCore import QModelIndex, QSortFilterProxyModel
+from PySide6.QtWidgets import QAbstractItemView, QTableView
+from ui.components.base_tables.base_table_model import BaseTableModel
 
 """
 A reusable, dark-themed QTableView used across multiple pages. Many pages in the application display 
@@ -8,6 +10,17 @@ settings: alternating dark rows, green selection highlight, row-based selection,
 QSortFilterProxyModel, hidden vertical row numbers, smooth hover tracking for action-button delegates 
 (Edit/Delete/Order). This page is used for Expense Reports and Mileage Tracker (the rest of the pages
 have functions which require specific action pages.
+
+ui.components.base_tables.base_table_view.py index:
+
+class BaseTableView(): Shared dark-themed table view.
+ - def __init__(): Apply universal styling + behavior
+ - def set_source_model(): Attach a model; a BaseTableModel behind a proxy exposes every row
+ - def begin_bulk_update(): Pause repaints and proxy re-sorting while the model is loaded or edited
+ - def end_bulk_update(): Re-sort/re-filter once and resume repaints
+ - def _on_sort_indicator_changed(): Fetch every row before a user sort
+ - def _on_model_reset(): Keep a user sort global after the model reloads
+ - def _fetch_all(): Pull all remaining batches from an incrementally loaded model
 """
 
 class BaseTableView(QTableView):
@@ -28,6 +41,10 @@ class BaseTableView(QTableView):
         self.setSortingEnabled(True)
         # When a QSortFilterProxyModel is used, clicking column headers sorts the data.
 
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        # Smooth scrolling; models that load rows in batches (BaseTableModel.fetchMore) only
+        # materialize the rows near the viewport.
+
         # -------------------------self.setStyleSheet-------------------------------
         self.setStyleSheet("""
             QTableView {
@@ -60,4 +77,81 @@ class BaseTableView(QTableView):
 
         self.setMouseTracking(True)
         # Enable mouse tracking WITHOUT holding mouse buttons. Required for highlighting
-        # mini action buttons on hover and changing button color when the cursor moves over.
\ No newline at end of file
+        # mini action buttons on hover and changing button color when the cursor moves over.
+
+        # Nesting depth of begin_bulk_update()/end_bulk_update() pairs, and the proxy's
+        # dynamicSortFilter setting to restore when the outermost pair ends
+        self._bulk_depth = 0
+        self._bulk_dynamic = True
+
+        # A sort must see every row, not only the batches fetched so far; once the user sorts,
+        # remaining rows are fetched (now and after every reload).
+        self._user_sorted = False
+        header.sortIndicatorChanged.connect(self._on_sort_indicator_changed)
+
+    def set_source_model(self, model):
+        # Attach a model to the view. Behind a QSortFilterProxyModel, a BaseTableModel stops
+        # loading rows in batches: the proxy can only filter/sort the rows it has been given,
+        # so a text filter would otherwise miss every row the view had not scrolled to yet.
+        if isinstance(model, QSortFilterProxyModel):
+            source = model.sourceModel()
+            if isinstance(source, BaseTableModel):
+                source.set_fetch_in_batches(False)
+        self.setModel(model)
+        if model is not None:
+            model.modelReset.connect(self._on_model_reset)
+
+    def begin_bulk_update(self):
+        # Call before loading or editing many rows; repaints are paused until the matching
+        # end_bulk_update(), and a proxy stops re-sorting/re-filtering on every change from
+        # the source until then. Pairs may be nested.
+        self._bulk_depth += 1
+        if self._bulk_depth == 1:
+            self.setUpdatesEnabled(False)
+            model = self.model()
+            if isinstance(model, QSortFilterProxyModel):
+                self._bulk_dynamic = model.dynamicSortFilter()
+                model.setDynamicSortFilter(False)
+
+    def end_bulk_update(self):
+        # Closes a begin_bulk_update(). The outermost call re-sorts/re-filters a proxy once
+        # (instead of once per changed row), restores its dynamic sorting and resumes
+        # repaints. If the user has sorted, rows the reload added beyond the fetched batches
+        # are pulled in first so the sort covers them.
+        if self._bulk_depth == 0:
+            return
+        self._bulk_depth -= 1
+        if self._bulk_depth:
+            return
+
+        if self._user_sorted:
+            self._fetch_all()
+        model = self.model()
+        if isinstance(model, QSortFilterProxyModel):
+            model.invalidate()
+            model.setDynamicSortFilter(self._bulk_dynamic)
+        self.setUpdatesEnabled(True)
+
+    def _on_sort_indicator_changed(self, *_):
+        # The user sorted by a column: pull in every row so the order covers the whole dataset.
+        self._user_sorted = True
+        self._fetch_all()
+
+    def _on_model_reset(self):
+        # After a reload only the first batch is exposed; keep an active user sort global.
+        if self._user_sorted:
+            self._fetch_all()
+
+    def _fetch_all(self):
+        # Drains an incrementally loaded model, then re-sorts a proxy once (rows fetched while
+        # its dynamic sorting is paused would otherwise land unsorted at the end).
+        model = self.model()
+        if model is None:
+            return
+        root = QModelIndex()
+        if not model.canFetchMore(root):
+            return
+        while model.canFetchMore(root):
+            model.fetchMore(root)
+        if isinstance(model, QSortFilterProxyModel):
+            model.invalidate()
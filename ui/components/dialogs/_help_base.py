@@ -0,0 +1,99 @@
+from __future__ import annotations
+from functools import lru_cache
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QTextDocument
+from PySide6.QtWidgets import QDialog, QDialogButtonBox, QVBoxLayout, QLabel, QTextBrowser
+from core.utils import pointing_cursor
+
+"""
+This module defines BaseHelpDialog, the common base of the per-page help windows (Equipment, Expense,
+Inventory, Mileage, Parts and Service Activity). It builds the shared layout-- a title, the page's help
+HTML in a single text browser, and a Close button-- so each subclass only supplies its window title,
+heading, and HTML. It also lets each page open its help window through
+show_for(), which builds the dialog the first time Help is clicked and reuses that same instance on
+every later click, instead of rebuilding the labels and rich text each time. The dialogs also share
+one stylesheet, applied once per dialog instead of once per label and button.
+
+ui.components.dialogs._help_base.py index:
+
+def help_document(): Parsed QTextDocument for a help page's HTML, built once per page
+class BaseHelpDialog(): Common base for the page help dialogs
+ - def __init__(): Builds the title, help body and Close button with the shared stylesheet
+ - def show_for(): Opens the page's help dialog, building it on first use only
+"""
+
+# Shared help-window styling: body text, the title label (objectName "helpTitle"), the help text
+# browser and the Close button. Set on the dialog so Qt parses it once per dialog.
+HELP_QSS = """
+    QLabel { color: #ddd; }
+    QLabel#helpTitle { font: bold 20px 'Segoe UI'; color: #00ff99; }
+    QTextBrowser { color: #ddd; background: transparent; }
+    QPushButton {
+        background-color: #444;
+        color: #fff;
+        border-radius: 6px;
+        padding: 6px;
+    }
+    QPushButton:hover {
+        background-color: #555;
+    }
+"""
+
+@lru_cache(maxsize=None)
+def help_document(html: str) -> QTextDocument:
+    # Parses a help page's HTML into a document once; dialogs show a clone of it, so reopening
+    # help (or opening it from a rebuilt page) never runs the HTML parser again.
+    doc = QTextDocument()
+    doc.setHtml(html)
+    return doc
+
+class BaseHelpDialog(QDialog):
+    # Base class for the help windows; subclasses pass their window title, heading and HTML.
+    def __init__(self, window_title: str, heading: str, html: str, parent=None, size=(650, 520)):
+        super().__init__(parent)
+        self.setStyleSheet(HELP_QSS)
+        self.setWindowTitle(window_title)
+        # Help content is static, so the size is fixed and never recomputed from the children's size hints
+        self.setFixedSize(*size)
+        self.setSizeGripEnabled(False)
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+
+        # Title
+        title = QLabel(heading)
+        title.setObjectName("helpTitle")
+        layout.addWidget(title)
+
+        # Help sections, one document shown in a single text browser
+        body = QTextBrowser()
+        body.setOpenLinks(False)
+        body.setFrameShape(QTextBrowser.NoFrame)
+        doc = help_document(html).clone(body)
+        doc.setDefaultFont(body.font())
+        body.setDocument(doc)
+        layout.addWidget(body, stretch=1)
+
+        # Close Button, right-aligned by the button box itself
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        btn_close = buttons.button(QDialogButtonBox.Close)
+        btn_close.setFixedWidth(120)
+        btn_close.setCursor(pointing_cursor())
+        # Close is a reject-role button; keep the dialog's result Accepted as before.
+        # Same-thread sender and receiver: call accept() directly rather than via auto-connection
+        buttons.rejected.connect(self.accept, Qt.DirectConnection)
+        layout.addWidget(buttons)
+
+    @classmethod
+    def show_for(cls, parent):
+        # Opens this help dialog for 'parent' (the page). The dialog is only constructed the
+        # first time; the instance is kept on the parent and shown again on later clicks.
+        # WA_DeleteOnClose is deliberately left off: it would destroy the cached dialog on close,
+        # and with one instance per page the memory held is already bounded.
+        attr = f"_{cls.__name__}_instance"
+        dlg = getattr(parent, attr, None)
+        if dlg is None:
+            dlg = cls(parent)
+            setattr(parent, attr, dlg)
+        dlg.exec()
+        return dlg
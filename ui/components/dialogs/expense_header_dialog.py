@@ -1,5 +1,6 @@
 from __future__ import annotations
 from datetime import date
+from functools import lru_cache
 from typing import Optional
 from PySide6.QtCore import QDate
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout, QLineEdit,QDateEdit, QDialogButtonBox)
@@ -11,15 +12,69 @@ page which need to be filled out prior to exporting the expense report to the bl
 so that these fields are properly filled in within the destination Excel document.
 """
 
+@lru_cache(maxsize=1)
+def _today_qdate(ordinal: int) -> QDate:
+    # Today's QDate, built once per calendar day (keyed by date.today().toordinal()).
+    return QDate.currentDate()
+
+def _to_qdate(d: Optional[date]) -> QDate:
+    # Header date as a QDate for the editors; a missing date defaults to today.
+    if d is None:
+        return _today_qdate(date.today().toordinal())
+    return QDate(d.year, d.month, d.day)
+
 class ExpenseHeaderDialog(QDialog):
+    # (header attribute, line-edit attribute) pairs copied back, stripped, by apply_to_header
+    _TEXT_FIELDS = (
+        ("name", "name_edit"),
+        ("employee_number", "emp_edit"),
+        ("telephone_number", "tel_edit"),
+        ("mail_team", "mail_team_edit"),
+        ("group", "group_edit"),
+        ("division", "division_edit"),
+        ("destination_purpose", "dest_purpose_edit"),
+        ("bc", "bc_edit"),
+        ("account_number", "account_edit"),
+    )
+
+    # (header attribute, date-edit attribute) pairs for the date fields
+    _DATE_FIELDS = (
+        ("report_date", "report_date_edit"),
+        ("start_date", "start_date_edit"),
+        ("end_date", "end_date_edit"),
+    )
+
     def __init__(self, parent, header: ExpenseReportHeader):
         super().__init__(parent)
         self.setWindowTitle("Expense Report Info")
         self.header = header
 
         layout = QVBoxLayout(self)
-        form = QFormLayout()
-        layout.addLayout(form)
+        self._form = QFormLayout()
+        layout.addLayout(self._form)
+        # Form fields are built on first show, so a dialog that is created but never shown
+        # skips constructing its editors.
+        self._fields_built = False
+
+        # Buttons
+        btns = QDialogButtonBox(QDialogButtonBox.Cancel | QDialogButtonBox.Ok)
+        btns.accepted.connect(self.accept)
+        btns.rejected.connect(self.reject)
+        layout.addWidget(btns)
+
+    def showEvent(self, event):
+        # Build the form rows the first time the dialog is shown, then size the dialog to fit
+        # them before the window is mapped.
+        if not self._fields_built:
+            self._build_fields()
+            self.adjustSize()
+        super().showEvent(event)
+
+    def _build_fields(self):
+        # Creates the header editors from the current header values and adds the form rows.
+        self._fields_built = True
+        header = self.header
+        form = self._form
 
         # --- Text fields ---
         self.name_edit = QLineEdit(header.name)
@@ -32,23 +87,15 @@ class ExpenseHeaderDialog(QDialog):
         self.bc_edit = QLineEdit(header.bc)
         self.account_edit = QLineEdit(header.account_number)
 
-        # Dates
-        def to_qdate(d: Optional[date]) -> QDate:
-            if d is None:
-                return QDate.currentDate()
-            return QDate(d.year, d.month, d.day)
-
-        self.report_date_edit = QDateEdit()
-        self.report_date_edit.setCalendarPopup(True)
-        self.report_date_edit.setDate(to_qdate(header.report_date))
-
-        self.start_date_edit = QDateEdit()
-        self.start_date_edit.setCalendarPopup(True)
-        self.start_date_edit.setDate(to_qdate(header.start_date))
-
-        self.end_date_edit = QDateEdit()
-        self.end_date_edit.setCalendarPopup(True)
-        self.end_date_edit.setDate(to_qdate(header.end_date))
+        # Dates (the initial QDates are kept so apply_to_header can skip unchanged ones)
+        self._initial_qdates = {}
+        for header_attr, edit_attr in self._DATE_FIELDS:
+            qdate = _to_qdate(getattr(header, header_attr))
+            date_edit = QDateEdit()
+            date_edit.setCalendarPopup(True)
+            date_edit.setDate(qdate)
+            setattr(self, edit_attr, date_edit)
+            self._initial_qdates[header_attr] = qdate
 
         # Add form rows
         form.addRow("Name:", self.name_edit)
@@ -64,24 +111,20 @@ class ExpenseHeaderDialog(QDialog):
         form.addRow("B/C:", self.bc_edit)
         form.addRow("Account Number:", self.account_edit)
 
-        # Buttons
-        btns = QDialogButtonBox(QDialogButtonBox.Cancel | QDialogButtonBox.Ok)
-        btns.accepted.connect(self.accept)
-        btns.rejected.connect(self.reject)
-        layout.addWidget(btns)
-
     def apply_to_header(self):
-        # Copy widget values back into the header dataclass.
-        self.header.name = self.name_edit.text().strip()
-        self.header.employee_number = self.emp_edit.text().strip()
-        self.header.telephone_number = self.tel_edit.text().strip()
-        self.header.mail_team = self.mail_team_edit.text().strip()
-        self.header.group = self.group_edit.text().strip()
-        self.header.division = self.division_edit.text().strip()
-        self.header.destination_purpose = self.dest_purpose_edit.text().strip()
-        self.header.bc = self.bc_edit.text().strip()
-        self.header.account_number = self.account_edit.text().strip()
-
-        self.header.report_date = self.report_date_edit.date().toPython()
-        self.header.start_date = self.start_date_edit.date().toPython()
-        self.header.end_date = self.end_date_edit.date().toPython()
+        # Copy widget values back into the header dataclass. Nothing to copy if the dialog was
+        # never shown (the editors were never built, so the header is unchanged).
+        if not self._fields_built:
+            return
+
+        header = self.header
+        for header_attr, edit_attr in self._TEXT_FIELDS:
+            setattr(header, header_attr, getattr(self, edit_attr).text().strip())
+
+        # Dates: a date the user left untouched keeps the header's existing value, so only
+        # edited dates (or missing ones that defaulted to today) are converted back.
+        for header_attr, edit_attr in self._DATE_FIELDS:
+            qdate = getattr(self, edit_attr).date()
+            if getattr(header, header_attr) is not None and qdate == self._initial_qdates[header_attr]:
+                continue
+            setattr(header, header_attr, qdate.toPython())
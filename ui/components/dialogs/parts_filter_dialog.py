@@ -1,18 +1,40 @@
 from __future__ import annotations
 from typing import List, Dict
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QCursor
 from PySide6.QtWidgets import (QLabel, QPushButton, QDialog, QVBoxLayout as QVLayout, QHBoxLayout as QHLayout,
                                QLineEdit, QFormLayout)
+from core.utils import pointing_cursor
 
 """
 This module defines the PartsFilterDialog-- a header-like filter window that allows users to enter
 either an ID, Part Number, Model, Description, or Quantity unique to individual orders that may need
 to be searched.
+
+ui.components.dialogs.parts_filter_dialog.py index:
+
+def _norm(): Trims and lowercases filter text the way the parts proxy compares it
+class _FilterEdit(): Filter line edit with the shared "Contains..." placeholder
+class PartsFilterDialog(): Column filter window for the Parts table
+ - def __init__(): Builds one filter row per filterable column plus the Clear/Apply/Cancel buttons
+ - def _clear(): Clears all text filter fields
+ - def get_filters(): Returns the entered filters keyed by column index
 """
 
+def _norm(text: str) -> str:
+    # Normalizes filter text the way PartsFilterProxy compares it (trimmed, lowercase); empty
+    # fields, the common case, return at once without building temporary strings.
+    return text.strip().lower() if text else ""
+
+# Line edit for one column's filter, with the shared placeholder text built in.
+class _FilterEdit(QLineEdit):
+    def __init__(self, text: str = ""):
+        super().__init__(text)
+        self.setPlaceholderText("Contains...")
+
 # Filter dialog for editing column-based substring filters.
 class PartsFilterDialog(QDialog):
+    # Columns that never get a filter field
+    _SKIP_KEYS = frozenset(("actions", "user"))
+
     def __init__(self, parent, columns: List[str], labels: Dict[str, str], current_filters: Dict[int, str]):
         super().__init__(parent)
         self.setWindowTitle("Filter Parts Orders")
@@ -21,7 +43,9 @@ class PartsFilterDialog(QDialog):
         self.columns = columns
         self.labels = labels
         self.current_filters = current_filters
-        self._edits: Dict[int, QLineEdit] = {}
+        # Filter editors and the column index each one filters, as parallel lists
+        self._col_indices: List[int] = []
+        self._edit_widgets: List[QLineEdit] = []
 
         layout = QVLayout(self)
 
@@ -33,21 +57,25 @@ class PartsFilterDialog(QDialog):
         layout.addWidget(info)
 
         form = QFormLayout()
+        # Labels always sit beside their fields, so the form never re-lays rows out for wrapping
+        form.setRowWrapPolicy(QFormLayout.DontWrapRows)
         layout.addLayout(form)
 
         # Build filter rows
         for col_idx, key in enumerate(self.columns):
-            if key == "actions" or key == "user":
+            if key in self._SKIP_KEYS:
                 continue
 
             label = labels.get(key, key)
-            edit = QLineEdit()
-            edit.setPlaceholderText("Contains...")
-            existing = self.current_filters.get(col_idx, "")
-            edit.setText(existing)
+            edit = _FilterEdit()
+            existing = self.current_filters.get(col_idx)
+            # Unfiltered columns (the usual case) leave the new edit empty rather than setText("")
+            if existing:
+                edit.setText(existing)
 
             form.addRow(label + ":", edit)
-            self._edits[col_idx] = edit
+            self._col_indices.append(col_idx)
+            self._edit_widgets.append(edit)
 
         # Buttons
         btn_row = QHLayout()
@@ -56,7 +84,7 @@ class PartsFilterDialog(QDialog):
         btn_cancel = QPushButton("Cancel")
 
         for b in (btn_clear, btn_ok, btn_cancel):
-            b.setCursor(QCursor(Qt.PointingHandCursor))
+            b.setCursor(pointing_cursor())
 
         btn_row.addStretch()
         btn_row.addWidget(btn_clear)
@@ -70,14 +98,13 @@ class PartsFilterDialog(QDialog):
 
     def _clear(self):
         # Clears all text filter fields.
-        for e in self._edits.values():
+        for e in self._edit_widgets:
             e.clear()
 
     def get_filters(self) -> Dict[int, str]:
         # Returns a dictionary of filters entered in the dialog.
-        results: Dict[int, str] = {}
-        for col_idx, edit in self._edits.items():
-            text = (edit.text() or "").strip().lower()
-            if text:
-                results[col_idx] = text
-        return results
\ No newline at end of file
+        return {
+            col_idx: text
+            for col_idx, edit in zip(self._col_indices, self._edit_widgets)
+            if (text := _norm(edit.text()))
+        }
\ No newline at end of file
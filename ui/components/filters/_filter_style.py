@@ -0,0 +1,23 @@
+"""
+This module holds the stylesheet shared by the "Filters & Columns" windows that the column filter
+popup modules (Equipment, Inventory and Service Activity) build. The stylesheet is set once on the
+dialog instead of on every checkbox, value list and title label, and the column section titles draw their own
+divider line instead of adding a separate QFrame per column.
+
+ui.components.filters._filter_style.py index:
+
+FILTER_WINDOW_QSS: Stylesheet applied to each Filters & Columns dialog
+"""
+
+# Value lists and checkboxes, the per-column section titles (objectName "filterColTitle", underlined to
+# separate the sections) and the "Visible Columns" heading (objectName "filterSectionTitle").
+FILTER_WINDOW_QSS = """
+    QCheckBox, QListView { color: #ddd; }
+    QLabel#filterColTitle {
+        color: #00ff99;
+        font: bold 13px "Segoe UI";
+        border-bottom: 1px solid #333;
+        padding-bottom: 2px;
+    }
+    QLabel#filterSectionTitle { color: #00ff99; font: bold 14px "Segoe UI"; }
+"""
@@ -0,0 +1,115 @@
+from __future__ import annotations
+from typing import Iterable, List, Set
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtWidgets import QCheckBox, QListView
+
+"""
+This module builds the per-column value lists used by the "Filters & Columns" windows of the
+column filter popup modules (Equipment, Inventory and Service Activity). Each column's distinct
+values are shown as checkable rows of a QListView backed by a QStandardItemModel, so Qt only
+creates and lays out widgets for the rows currently on screen, however many distinct values a
+column has. The raw value of each row ("" for the "(blank)" entry) is stored on its item, so the
+selection is read back without parsing the row text.
+
+ui.components.filters._value_list.py index:
+
+def build_value_list(): Checkable list view with one row per value
+def checked_values(): Raw values of the checked rows
+def set_all_checked(): Checks or unchecks every row
+def set_checked_values(): Checks exactly the rows whose value is in a given set
+def set_boxes_checked(): Checks or unchecks a group of checkboxes with one repaint
+"""
+
+# Rows shown before a column's value list starts scrolling on its own
+_MAX_VISIBLE_ROWS = 8
+
+def build_value_list(values: List[str], preselected: Set[str],
+                     max_rows: int | None = _MAX_VISIBLE_ROWS) -> QListView:
+    # Builds a list view with one checkable row per value, checked if the value is in
+    # 'preselected'. The view's model (a QStandardItemModel) holds the raw values under
+    # Qt.UserRole. With 'max_rows' the view is sized to at most that many rows; with None it
+    # keeps its normal size policy and fills the space its layout gives it.
+    items = []
+    for v in values:
+        item = QStandardItem(v if v else "(blank)")
+        item.setData(v, Qt.UserRole)
+        item.setEditable(False)
+        item.setCheckable(True)
+        item.setCheckState(Qt.Checked if v in preselected else Qt.Unchecked)
+        items.append(item)
+
+    view = QListView()
+    model = QStandardItemModel(view)
+    # All rows are added in one insert, before the view is attached
+    model.invisibleRootItem().appendRows(items)
+    view.setModel(model)
+    view.setUniformItemSizes(True)
+    view.setSelectionMode(QListView.NoSelection)
+
+    if max_rows is None:
+        return view
+
+    # Tall enough for a handful of rows; longer lists scroll inside the view
+    rows = min(len(values), max_rows)
+    row_height = view.sizeHintForRow(0) if values else 0
+    view.setFixedHeight(rows * row_height + 2 * view.frameWidth())
+    return view
+
+def checked_values(model: QStandardItemModel) -> Set[str]:
+    # Returns the raw values of every checked row.
+    selected = set()
+    for row in range(model.rowCount()):
+        item = model.item(row)
+        if item.checkState() == Qt.Checked:
+            selected.add(item.data(Qt.UserRole))
+    return selected
+
+def set_all_checked(model: QStandardItemModel, checked: bool):
+    # Checks (or unchecks) every row. The model's per-item change signals are held back and
+    # replaced by one dataChanged() covering all rows, so attached views refresh once.
+    state = Qt.Checked if checked else Qt.Unchecked
+    rows = model.rowCount()
+    if not rows:
+        return
+    model.blockSignals(True)
+    try:
+        for row in range(rows):
+            model.item(row).setCheckState(state)
+    finally:
+        model.blockSignals(False)
+    model.dataChanged.emit(model.index(0, 0), model.index(rows - 1, 0), [Qt.CheckStateRole])
+
+def set_checked_values(model: QStandardItemModel, values: Set[str]):
+    # Checks the rows whose raw value is in 'values' and unchecks the rest, with one
+    # dataChanged() for the whole list (as set_all_checked()).
+    rows = model.rowCount()
+    if not rows:
+        return
+    model.blockSignals(True)
+    try:
+        for row in range(rows):
+            item = model.item(row)
+            item.setCheckState(Qt.Checked if item.data(Qt.UserRole) in values else Qt.Unchecked)
+    finally:
+        model.blockSignals(False)
+    model.dataChanged.emit(model.index(0, 0), model.index(rows - 1, 0), [Qt.CheckStateRole])
+
+def set_boxes_checked(boxes: Iterable[QCheckBox], checked: bool):
+    # Checks (or unchecks) every checkbox in 'boxes' with their toggled signals blocked and
+    # their parent's painting paused, so the group is repainted once at the end.
+    boxes = list(boxes)
+    if not boxes:
+        return
+    parent = boxes[0].parentWidget()
+    if parent is not None:
+        parent.setUpdatesEnabled(False)
+    try:
+        for box in boxes:
+            box.blockSignals(True)
+            box.setChecked(checked)
+            box.blockSignals(False)
+    finally:
+        if parent is not None:
+            parent.setUpdatesEnabled(True)
+            parent.update()
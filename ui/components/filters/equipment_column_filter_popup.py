@@ -1,10 +1,14 @@
 from __future__ import annotations
-from typing import List, Dict, Set
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QCursor
+from typing import Dict, Set
+from PySide6.QtGui import QStandardItemModel
 from PySide6.QtWidgets import (QWidget, QLabel, QPushButton,
                                QMessageBox, QDialog, QVBoxLayout as QVLayout, QScrollArea, QCheckBox,
-                               QFrame, QHBoxLayout as QHLayout)
+                               QHBoxLayout as QHLayout)
+from core.utils import pointing_cursor
+from ui.components.filters._filter_style import FILTER_WINDOW_QSS
+from ui.components.filters.filter_proxy_models import filtered_unique_values
+from ui.components.filters._value_list import (build_value_list, checked_values, set_all_checked,
+                                                set_boxes_checked, set_checked_values)
 
 """
 This page provides the UI logic for filtering and customizing the display of a data table. It includes 
@@ -21,6 +25,7 @@ def open_column_filter_popup(): Show filter options for one column.
 def open_filter_window(): Open full-table filter/column settings.
  - def clear_filters_all(): Reset all filters and show all columns.
  - def apply_all(): Apply all filters and column visibility changes.
+ - def sync_checks(): Reset the check marks from the current filters and visible columns.
 def clear_filters(): Completely remove all filters and reset column visibility.
 """
 
@@ -34,13 +39,8 @@ def open_column_filter_popup(self, col_index: int):
     if col_name == "actions":
         return
 
-    filtered_items = self._get_current_filtered_items(exclude_col=col_name)
-
-    # Unique values in this column
-    unique_values = sorted({
-        ("" if getattr(it, col_name, "") is None else str(getattr(it, col_name, "")))
-        for it in filtered_items
-    })
+    # Distinct values of this column among the rows the other active filters keep
+    unique_values = filtered_unique_values(self.base_model, self.active_column_filters, col_name)
 
     dlg = QDialog(self)
     dlg.setWindowTitle(f"Filter: {self.column_labels.get(col_name, col_name)}")
@@ -48,28 +48,13 @@ def open_column_filter_popup(self, col_index: int):
     v = QVLayout(dlg)
     v.addWidget(QLabel(f"Filter by {self.column_labels.get(col_name, col_name)}"))
 
-    # Scroll list of checkboxes
-    scroll = QScrollArea()
-    scroll.setWidgetResizable(True)
-    w = QWidget()
-    list_layout = QVLayout(w)
-
     existing = self.active_column_filters.get(col_name)
     preselected = set(existing) if existing else set(unique_values)
 
-    cb_by_value: Dict[str, QCheckBox] = {}
-
-    # Create a checkbox for each possible value
-    for val in unique_values:
-        text = val if val else "(blank)"
-        cb = QCheckBox(text)
-        cb.setChecked(val in preselected)
-        list_layout.addWidget(cb)
-        cb_by_value[val] = cb
-
-    list_layout.addStretch()
-    scroll.setWidget(w)
-    v.addWidget(scroll)
+    # One checkable row per value, in a list view that only draws the rows on screen
+    value_list = build_value_list(unique_values, preselected, max_rows=None)
+    value_model = value_list.model()
+    v.addWidget(value_list, stretch=1)
 
     # Footer buttons: Select All, Clear All, Apply
     footer = QHLayout()
@@ -78,7 +63,7 @@ def open_column_filter_popup(self, col_index: int):
     btn_apply = QPushButton("Apply")
 
     for b in (btn_all, btn_none, btn_apply):
-        b.setCursor(QCursor(Qt.PointingHandCursor))
+        b.setCursor(pointing_cursor())
 
     footer.addWidget(btn_all)
     footer.addWidget(btn_none)
@@ -88,17 +73,15 @@ def open_column_filter_popup(self, col_index: int):
 
     def select_all():
     # Check all filter options.
-        for b in cb_by_value.values():
-            b.setChecked(True)
+        set_all_checked(value_model, True)
 
     def clear_all():
     # Uncheck all filter options.
-        for b in cb_by_value.values():
-            b.setChecked(False)
+        set_all_checked(value_model, False)
 
     def apply_and_close():
     # Apply column filter and close popup.
-        chosen = {val for val, cb in cb_by_value.items() if cb.isChecked()}
+        chosen = checked_values(value_model)
         if not chosen or len(chosen) == len(unique_values):
             self.active_column_filters.pop(col_name, None)
         else:
@@ -119,9 +102,24 @@ def open_column_filter_popup(self, col_index: int):
 def open_filter_window(self):
 # Opens full filter panel for users to choose visible columns/select values to
 # apply per column. Mirrors Inventory page functionality.
+    # The window built for the current data is kept on the page and reopened with its check
+    # marks brought back in line with the active filters and visible columns; it is only
+    # rebuilt once the model's data changes.
+    cached = getattr(self, "_filter_dialog_cache", None)
+    if cached is not None:
+        version, cached_dlg, sync_checks = cached
+        if version == self.base_model.data_version:
+            sync_checks()
+            cached_dlg.exec()
+            return
+        cached_dlg.deleteLater()
+        self._filter_dialog_cache = None
+
     dlg = QDialog(self)
     dlg.setWindowTitle("Filters & Columns")
     dlg.resize(520, 600)
+    # One stylesheet for every checkbox and title in the window
+    dlg.setStyleSheet(FILTER_WINDOW_QSS)
     outer = QVLayout(dlg)
     outer.setSpacing(10)
 
@@ -134,61 +132,46 @@ def open_filter_window(self):
     wrap_layout = QVLayout(wrap)
     wrap_layout.setSpacing(14)
 
-    # Mapping of column > list of checkboxes
-    self._checks_by_col: Dict[str, List[QCheckBox]] = {}
+    # Value list model per column (checkable rows holding the raw values)
+    self._value_models_by_col: Dict[str, QStandardItemModel] = {}
+    value_models = self._value_models_by_col
 
     src_model = self.base_model
+    data_version = src_model.data_version
     headers = src_model.columns
-    data_items = src_model.items
 
     # Create filter options for each column
     for col_name in headers:
         if col_name == "actions":
             continue
 
-        # Get unique possible values
-        values = sorted({
-            "" if getattr(it, col_name, "") is None else str(getattr(it, col_name, ""))
-            for it in data_items
-        })
+        # Unique possible values (cached on the model until its items change)
+        values = src_model.unique_values(col_name)
 
         title = QLabel(self.column_labels.get(col_name, col_name))
-        title.setStyleSheet('color:#00ff99; font: bold 13px "Segoe UI";')
+        title.setObjectName("filterColTitle")
         wrap_layout.addWidget(title)
 
-        checks: List[QCheckBox] = []
         existing = self.active_column_filters.get(col_name)
         preselected = set(existing) if existing else set(values)
 
-        # Checkbox for each value
-        for v in values:
-            cb = QCheckBox(v if v else "(blank)")
-            cb.setChecked(v in preselected)
-            cb.setStyleSheet("QCheckBox{color:#ddd;}")
-            wrap_layout.addWidget(cb)
-            checks.append(cb)
-
-        self._checks_by_col[col_name] = checks
-
-        # Separator line
-        sep = QFrame()
-        sep.setFrameShape(QFrame.HLine)
-        sep.setStyleSheet("background:#333; max-height:1px;")
-        wrap_layout.addWidget(sep)
+        # One checkable row per value, in a list view that only draws the rows on screen
+        value_list = build_value_list(values, preselected)
+        wrap_layout.addWidget(value_list)
+        self._value_models_by_col[col_name] = value_list.model()
 
     wrap_layout.addStretch(1)
     scroll.setWidget(wrap)
 
     # Column visibility section
     col_label = QLabel("Visible Columns")
-    col_label.setStyleSheet('color:#00ff99; font: bold 14px "Segoe UI";')
+    col_label.setObjectName("filterSectionTitle")
     outer.addWidget(col_label)
 
     visible_checks: Dict[str, QCheckBox] = {}
     for col_name in headers:
         cb = QCheckBox(self.column_labels.get(col_name, col_name))
         cb.setChecked(col_name in self.visible_columns)
-        cb.setStyleSheet("QCheckBox{color:#ddd;}")
         outer.addWidget(cb)
         visible_checks[col_name] = cb
 
@@ -200,7 +183,7 @@ def open_filter_window(self):
     btn_close = QPushButton("Close")
 
     for b in (btn_clear_filters, btn_apply, btn_close):
-        b.setCursor(QCursor(Qt.PointingHandCursor))
+        b.setCursor(pointing_cursor())
 
     footer.addWidget(btn_clear_filters)
     footer.addWidget(btn_apply)
@@ -214,15 +197,18 @@ def open_filter_window(self):
         self._update_header_icons()
 
         # Reset checkboxes
-        for checks in self._checks_by_col.values():
-            for cb in checks:
-                cb.setChecked(True)
+        # (every value list repaints once, after all of them are updated)
+        wrap.setUpdatesEnabled(False)
+        try:
+            for model in self._value_models_by_col.values():
+                set_all_checked(model, True)
+        finally:
+            wrap.setUpdatesEnabled(True)
 
         # Reset column visibility
         self.visible_columns = list(self.all_columns)
         self._apply_visible_columns()
-        for cb in visible_checks.values():
-            cb.setChecked(True)
+        set_boxes_checked(visible_checks.values(), True)
 
         dlg.accept()
 
@@ -230,12 +216,11 @@ def open_filter_window(self):
     # Gather new filter selections
         new_filters: Dict[str, Set[str]] = {}
 
-        for col, cbs in self._checks_by_col.items():
-            selected = {cb.text() if cb.text() != "(blank)" else "" for cb in cbs if cb.isChecked()}
-            all_vals = {cb.text() if cb.text() != "(blank)" else "" for cb in cbs}
+        for col, model in self._value_models_by_col.items():
+            selected = checked_values(model)
 
             # Only store filter if user unselected something
-            if selected and selected != all_vals:
+            if selected and len(selected) != model.rowCount():
                 new_filters[col] = selected
 
         # Update filters + header icons
@@ -253,10 +238,27 @@ def open_filter_window(self):
         self._apply_visible_columns()
         dlg.accept()
 
+    def sync_checks():
+        # Re-checks every value and "Visible Columns" box from the page's current filters and
+        # visible columns (the state the window would be built with).
+        wrap.setUpdatesEnabled(False)
+        try:
+            for col, model in value_models.items():
+                existing = self.active_column_filters.get(col)
+                if existing:
+                    set_checked_values(model, set(existing))
+                else:
+                    set_all_checked(model, True)
+        finally:
+            wrap.setUpdatesEnabled(True)
+        for col, cb in visible_checks.items():
+            cb.setChecked(col in self.visible_columns)
+
     btn_clear_filters.clicked.connect(clear_filters_all)
     btn_apply.clicked.connect(apply_all)
     btn_close.clicked.connect(dlg.reject)
 
+    self._filter_dialog_cache = (data_version, dlg, sync_checks)
     dlg.exec()
 
 # Top-bar clear filters button
@@ -269,7 +271,5 @@ def clear_filters(self):
     self.visible_columns = list(self.all_columns)
     self._apply_visible_columns()
 
-    # Force full table redraw
-    self.proxy.invalidate()
-    self.table.reset()
+    # Repaint once; set_filters() above already re-ran the filter for every row
     self.table.viewport().update()
\ No newline at end of file
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Dict, Set, List, Any
+import sys
+from operator import attrgetter
+from typing import Dict, Set, List, Any, Callable, Tuple
 from PySide6.QtCore import QSortFilterProxyModel, QModelIndex, Qt
 from ui.components.action_tables.inventory_table import InventoryTableModel
 from ui.components.action_tables.service_activity_table import ServiceActivityTableModel
@@ -13,30 +15,134 @@ rows in the underlying data model and hides those that don’t meet the active f
 enabling flexible, dynamic table filtering throughout the application.
 
 ui.components.filters.filter_proxy_models.py index:
+def _compile_filters(): Pairs each active allow-list with a prebuilt attribute getter
+def _row_test(): Row predicate specialized for one set of compiled filters
+def _active_filters(): The (column, allow-list) pairs that actually filter, most selective first
+def _row_mask(): Visibility of every source row under a set of active filters
+def filtered_unique_values(): Distinct values of one column among the rows passing the other filters
+def _cell_text(): Reads one attribute through a getter as filter text
 class ColumnFilterProxy(): Column-based allow-list filter proxy.
  - def __init__(): Initialize filter proxy.
  - def set_filters(): Replace filters and refresh.
+ - def setSourceModel(): Attach the source model and remember it for filtering.
  - def filterAcceptsRow(): Check if row matches filters.
 class ServiceActivityFilterProxy(): Filter proxy for Service Activity rows.
  - def __init__(): Initialize Service Activity filter.
  - def set_filters(): Replace filters and refresh.
+ - def setSourceModel(): Attach the source model and remember it for filtering.
  - def filterAcceptsRow(): Test row against filters.
- - def flags(): Return source model item flags.
+ - def _clear_flags_cache(): Forget cached item flags.
+ - def flags(): Return source model item flags, cached per cell.
 class InventoryFilterProxy(): Filter proxy for Inventory rows.
  - def __init__(): Initialize Inventory filter.
  - def set_filters(): Replace filters and refresh.
+ - def setSourceModel(): Attach the source model and remember it for filtering.
  - def filterAcceptsRow(): Test row against filters.
 class MileageFilterProxy(): Text-based substring filtering proxy.
  - def __init__(): Initialize text filter proxy.
  - def set_text_filter(): Set substring filter for column.
  - def clear_all_filters(): Remove all text filters.
+ - def setSourceModel(): Attach the source model and remember its lowercased column text.
  - def filterAcceptsRow(): Test row against filters.
 class PartsFilterProxy(): Case-insensitive substring filter per column.
  - def __init__(): Initialize parts filter.
  - def set_filters(): Replace filters and refresh.
+ - def setSourceModel(): Attach the source model and remember its lowercased column text.
  - def filterAcceptsRow(): Test row against filters.
 """
 
+def _compile_filters(filters: Dict[str, Set[str]], columns: List[str] | None = None,
+                     src: Any = None) -> List[Tuple[Callable, Set[str]]]:
+    # Turns {column: allow-list} into (attrgetter, allow-list) pairs, built once per
+    # set_filters() instead of resolving the attribute name on every row. Empty allow-lists (no
+    # filtering) and, if 'columns' is given, unknown column keys are dropped here; the order is
+    # the one _active_filters() picks.
+    return [(attrgetter(col_name), allowed) for col_name, allowed in _active_filters(filters, src, columns)]
+
+def _row_test(compiled: List[Tuple[Callable, Set[str]]]) -> Callable | None:
+    # Builds the per-row test for one set of compiled filters (None when nothing filters). The
+    # getters and allow-lists are bound into the function when the filters are set, and the
+    # usual one- and two-filter cases get a test without a loop.
+    if not compiled:
+        return None
+    if len(compiled) == 1:
+        ((getter, allowed),) = compiled
+
+        def test(item, getter=getter, allowed=allowed):
+            return _cell_text(getter, item) in allowed
+    elif len(compiled) == 2:
+        (getter_a, allowed_a), (getter_b, allowed_b) = compiled
+
+        def test(item, getter_a=getter_a, allowed_a=allowed_a, getter_b=getter_b, allowed_b=allowed_b):
+            return _cell_text(getter_a, item) in allowed_a and _cell_text(getter_b, item) in allowed_b
+    else:
+        pairs = tuple(compiled)
+
+        def test(item, pairs=pairs):
+            for getter, allowed in pairs:
+                if _cell_text(getter, item) not in allowed:
+                    return False
+            return True
+    return test
+
+def _active_filters(filters: Dict[str, Set[str]], src: Any = None,
+                    columns: List[str] | None = None) -> List[Tuple[str, Set[str]]]:
+    # The (column key, allow-list) pairs that actually filter; empty allow-lists (and, if
+    # 'columns' is given, unknown column keys) are dropped. A row must pass every filter, so
+    # when the source model can report a column's distinct values, the most selective filters
+    # (fewest allowed values relative to the values present) are put first: most hidden rows
+    # then fail on the first check. Allow-lists become frozensets of interned strings, so the
+    # per-row membership tests hash against the model's (also interned) column texts; a plain
+    # str allow-list keeps its substring meaning and is passed through unchanged.
+    active = [
+        (col_name, allowed if isinstance(allowed, str) else frozenset(map(sys.intern, allowed)))
+        for col_name, allowed in filters.items()
+        if allowed and (columns is None or col_name in columns)
+    ]
+    unique_values = getattr(src, "unique_values", None)
+    if unique_values is not None and len(active) > 1:
+        active.sort(key=lambda pair: len(pair[1]) / max(1, len(unique_values(pair[0]))))
+    return active
+
+def _row_mask(active: List[Tuple[str, Set[str]]], column_text: Callable, n: int) -> List[bool]:
+    # Visibility of every source row under the active filters, computed column by column over
+    # the model's cached column text, so filterAcceptsRow() is a single list index per row.
+    mask = [True] * n
+    for col_name, allowed in active:
+        mask = [keep and text in allowed for keep, text in zip(mask, column_text(col_name))]
+    return mask
+
+def filtered_unique_values(src: Any, filters: Dict[str, Set[str]], col_name: str) -> List[str]:
+    # Sorted distinct values of column 'col_name' among the rows that pass every active filter
+    # except the one on 'col_name' itself (what that column's filter popup offers). The rows
+    # passing each filter are collected from the model's value -> rows index and intersected,
+    # so no row object is read; with no other filter active this is the cached unique_values().
+    others = [(other, allowed) for other, allowed in _active_filters(filters) if other != col_name]
+    if not others:
+        return src.unique_values(col_name)
+
+    rows = None
+    for other, allowed in others:
+        matched = set()
+        for value, value_rows in src.value_rows(other).items():
+            if value in allowed:
+                matched.update(value_rows)
+        rows = matched if rows is None else rows & matched
+        if not rows:
+            return []
+
+    texts = src.column_text(col_name)
+    return sorted({texts[row] for row in rows})
+
+def _cell_text(getter: Callable, item: Any) -> str:
+    # Reads an attribute through its getter, as getattr(item, name, "") would: missing
+    # attributes and None both read as "", everything else as str().
+    try:
+        val = getter(item)
+    except AttributeError:
+        return ""
+    return "" if val is None else str(val)
+
 class ColumnFilterProxy(QSortFilterProxyModel):
     # A generic allow-list–based filtering proxy used by pages such as Inventory, Parts
     # Orders, and Service Activity. Only rows whose item.category AND item.model match the
@@ -46,53 +152,49 @@ class ColumnFilterProxy(QSortFilterProxyModel):
         super().__init__(parent)
         self.filters = filters
         self.columns = columns
+        # Test a row object must pass under the active filters (None when nothing filters)
+        self._row_test = _row_test(_compile_filters(filters, columns))
+        # Source model, if it has row objects ('items'); resolved in setSourceModel()
+        self._src = None
 
     def set_filters(self, filters: Dict[str, Set[str]]):
         # Replace all existing filters with a new filter dictionary, then force Qt to re-run
         # filterAcceptsRow() for every row. invalidateFilter() = "Something changed,
         # re-evaluate all row visibility."
         self.filters = filters
+        self._row_test = _row_test(_compile_filters(filters, self.columns, self.sourceModel()))
         self.invalidateFilter()
 
+    def setSourceModel(self, model):
+        # Attaches the source model. Whether it has row objects is checked here once, not on
+        # every filterAcceptsRow() call; its 'items' list is still read per call, since
+        # set_items() replaces it.
+        super().setSourceModel(model)
+        self._src = model if hasattr(model, "items") else None
+
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
         # Qt calls this once per row each time filtering is reapplied. Returns 'True' (keep
         # rows visible) or 'False' (hide row). The logic walks through each filter entry and
         # checks whether the corresponding attribute on the row object is inside the allow-list.
 
-        src = self.sourceModel()
+        # No active filters (the usual case): every row is visible
+        row_test = self._row_test
+        if row_test is None:
+            return True
+
+        src = self._src
         # If the model doesn't appear to have row objects, don't filter.
-        if not hasattr(src, "items"):
+        if src is None:
             return True
-        items: List[Any] = getattr(src, "items", [])
+        items: List[Any] = src.items
         if source_row < 0 or source_row >= len(items):
             return True
 
-        # Extract the Python object representing this row.
-        item = items[source_row]
-
-        #  Evaluate filter rules, a row must pass every active filter.
-        for col_name, allowed in self.filters.items():
-
-            # If set empty = no filtering on this column
-            if not allowed:
-                continue
-
-            # If the column key is not recognized, skip it
-            if col_name not in self.columns:
-                continue
-
-            # Read the item attribute using getattr
-            val = getattr(item, col_name, "")
-
-            # Convert None to "", and everything else to a string
-            sval = "" if val is None else str(val)
-
-            # If the cell value is NOT in the allow-list, the row fails
-            if sval not in allowed:
-                return False
-
-        # If no filter rejected the row, the row is accepted
-        return True
+        #  Evaluate filter rules on the Python object representing this row: it must pass every
+        # active filter. Empty allow-lists and unrecognized column keys were already left out
+        # when the filters were compiled; each attribute reads as a string (None / missing -> "")
+        # and must be in its allow-list.
+        return row_test(items[source_row])
 
 class ServiceActivityFilterProxy(QSortFilterProxyModel):
 # Filter proxy model; this layer sits between the raw data and the visible table, it hides
@@ -101,42 +203,68 @@ class ServiceActivityFilterProxy(QSortFilterProxyModel):
         super().__init__()
         self.filters = filters
         self.all_columns = all_columns
+        # Active filters as (column key, allow-list) pairs; values come from the model's
+        # per-column text cache
+        self._active = _active_filters(filters)
+        # Row visibility under the active filters, and the source data version it was built from
+        self._mask: List[bool] | None = None
+        self._mask_version = -1
+        # Source model when it is the expected table model (None otherwise); set in setSourceModel()
+        self._src = None
+        # Item flags by (proxy row, column); Qt asks for them on every paint. Emptied whenever
+        # the proxy's rows are reset, moved (sorting, filtering), inserted or removed.
+        self._flags_cache: Dict[Tuple[int, int], Qt.ItemFlags] = {}
+        for signal in (self.modelReset, self.layoutChanged, self.rowsInserted, self.rowsRemoved):
+            signal.connect(self._clear_flags_cache)
 
     def set_filters(self, filters: Dict[str, Set[str]]):
         # Replaces the active filters and triggers row re-evaluation.
         self.filters = filters
+        self._active = _active_filters(filters, self.sourceModel())
+        self._mask = None
+        self._flags_cache.clear()
         self.invalidateFilter()
 
+    def setSourceModel(self, model):
+        # Attaches the source model; its type is checked once here instead of per row.
+        super().setSourceModel(model)
+        self._src = model if isinstance(model, ServiceActivityTableModel) else None
+        self._mask = None
+        self._flags_cache.clear()
+        if model is not None:
+            model.dataChanged.connect(self._clear_flags_cache)
+
+    def _clear_flags_cache(self, *args):
+        # Drops every cached flag value (connected to the signals that change which source
+        # cell a proxy index stands for).
+        self._flags_cache.clear()
+
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
         # Determines whether a row matches the active per-column filter sets.
-        src: ServiceActivityTableModel = self.sourceModel()
-        if not isinstance(src, ServiceActivityTableModel):
+        if not self._active:
+            # No active filters: show every row.
             return True
-        item = src.items[source_row]
-
-        # Check each active filter rule.
-        for col_name, allowed in self.filters.items():
-            if not allowed:
-                continue
-
-            val = getattr(item, col_name, "")
-            sval = "" if val is None else str(val)
-            if sval not in allowed:
-                # One filter fails = hide row.
-                return False
-
-        # If all filters passed, show the row.
-        return True
+        src = self._src
+        if src is None:
+            return True
+        # Every row is checked against every active filter in one pass when the filters or the
+        # data change; a row is visible only if all filters passed.
+        mask = self._mask
+        if mask is None or self._mask_version != src.data_version:
+            mask = self._mask = _row_mask(self._active, src.column_text, len(src.items))
+            self._mask_version = src.data_version
+        return mask[source_row]
 
     def flags(self, index):
         if not index.isValid():
             return Qt.ItemIsEnabled
 
-        # Map the proxy index to the source index
-        src_index = self.mapToSource(index)
-
-        # Return the flags from the source model
-        return self.sourceModel().flags(src_index)
+        key = (index.row(), index.column())
+        flags = self._flags_cache.get(key)
+        if flags is None:
+            # Map the proxy index to the source index and ask the source model once
+            flags = self._flags_cache[key] = self.sourceModel().flags(self.mapToSource(index))
+        return flags
 
 class InventoryFilterProxy(QSortFilterProxyModel):
 # Filter proxy model; this layer sits between the raw data and the visible table, it hides
@@ -145,29 +273,44 @@ class InventoryFilterProxy(QSortFilterProxyModel):
         super().__init__()
         self.filters = filters
         self.all_columns = all_columns
+        # Active filters as (column key, allow-list) pairs; values come from the model's
+        # per-column text cache
+        self._active = _active_filters(filters)
+        # Row visibility under the active filters, and the source data version it was built from
+        self._mask: List[bool] | None = None
+        self._mask_version = -1
+        # Source model when it is the expected table model (None otherwise); set in setSourceModel()
+        self._src = None
 
     def set_filters(self, filters: Dict[str, Set[str]]):
         # Replace filters and trigger a re-check of all rows.
         self.filters = filters
+        self._active = _active_filters(filters, self.sourceModel())
+        self._mask = None
         self.invalidateFilter()
 
+    def setSourceModel(self, model):
+        # Attach the source model, checking its type once rather than for every row.
+        super().setSourceModel(model)
+        self._src = model if isinstance(model, InventoryTableModel) else None
+        self._mask = None
+
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
         # For each row coming from the base model, decide "keep" (True) or "hide" (False)
-        src: InventoryTableModel = self.sourceModel()  # type: ignore
-        if not isinstance(src, InventoryTableModel):
+        if not self._active:
+            # Nothing is filtered, keep every row
             return True
-        item = src.items[source_row]
-
-        # Check every active filter; if any filter does not match, hide the row.
-        for col_name, allowed in self.filters.items():
-            if not allowed:
-                # If the set of allowed values is empty, skip that filter.
-                continue
-            val = getattr(item, col_name, "")
-            sval = "" if val is None else str(val)
-            if sval not in allowed:
-                return False
-        return True
+        src = self._src
+        if src is None:
+            return True
+        # Rows are checked against every active filter in one pass whenever the filters or the
+        # items change (filters with an empty set of allowed values were left out by
+        # set_filters); a row is kept only if no filter rejected it.
+        mask = self._mask
+        if mask is None or self._mask_version != src.data_version:
+            mask = self._mask = _row_mask(self._active, src.column_text, len(src.items))
+            self._mask_version = src.data_version
+        return mask[source_row]
 
 class MileageFilterProxy(ColumnFilterProxy):
 # Filter proxy model; this layer sits between the raw data and the visible table, it hides
@@ -175,6 +318,10 @@ class MileageFilterProxy(ColumnFilterProxy):
     def __init__(self, columns: List[str], parent=None):
         super().__init__(filters={}, columns=columns, parent=parent)
         self._text_filters: Dict[str, str] = {}
+        # Active text filters as (column index, lowercase needle) pairs
+        self._text_cols: List[Tuple[int, str]] = []
+        # The source model's lower_column_text(), looked up once in setSourceModel()
+        self._lower_text = None
 
     def set_text_filter(self, column_key: str, text: str):
         # Sets or clears a substring filter for the chosen column.
@@ -186,6 +333,9 @@ class MileageFilterProxy(ColumnFilterProxy):
         else:
             # Store new substring filter
             self._text_filters[column_key] = text
+        self._text_cols = [
+            (self.columns.index(key), needle) for key, needle in self._text_filters.items() if key in self.columns
+        ]
 
         # Tell Qt to re-check each row
         self.invalidateFilter()
@@ -193,26 +343,29 @@ class MileageFilterProxy(ColumnFilterProxy):
     def clear_all_filters(self):
         # Remove every filter and refresh table.
         self._text_filters.clear()
+        self._text_cols = []
         self.invalidateFilter()
 
+    def setSourceModel(self, model):
+        # Attaches the source model and keeps its lower_column_text() (None if it has none),
+        # which serves each column's display text already lowercased.
+        super().setSourceModel(model)
+        self._lower_text = getattr(model, "lower_column_text", None)
+
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
         # Determines whether a row passes all active filters.
-        src = self.sourceModel()
-
-        # Must use get_item() from the base model
-        if not hasattr(src, "get_item"):
+        if not self._text_cols:
+            # No text filters, every row passes
             return True
 
-        item = src.get_item(source_row)
-        if item is None:
+        # Must use the base model's cached column text
+        lower_text = self._lower_text
+        if lower_text is None:
             return True
 
-        # Check each filter
-        for col_key, needle in self._text_filters.items():
-            val = getattr(item, col_key, "")
-            sval = "" if val is None else str(val).lower()
-
-            if needle not in sval:
+        # Check each filter against the cell's displayed text (needles are lowercased already)
+        for col, needle in self._text_cols:
+            if needle not in lower_text(col)[source_row]:
                 # If any filter doesn't match, hide row
                 return False
 
@@ -224,30 +377,36 @@ class PartsFilterProxy(QSortFilterProxyModel):
         super().__init__()
         self.columns = columns
         self.column_filters: Dict[int, str] = {}
+        # Non-blank filters as (column index, lowercase text) pairs
+        self._text_cols: List[Tuple[int, str]] = []
+        # The source model's lower_column_text(), looked up once in setSourceModel()
+        self._lower_text = None
 
     def set_filters(self, filters: Dict[int, str]):
         # Receives a dictionary of substring filters for specific columns.
         self.column_filters = filters
+        self._text_cols = [(col_idx, text) for col_idx, text in filters.items() if text]
         self.invalidateFilter()
 
+    def setSourceModel(self, model):
+        # Attaches the source model and keeps its lower_column_text() (None if it has none), so
+        # cells are read from the model's display cache instead of through index() and data().
+        super().setSourceModel(model)
+        self._lower_text = getattr(model, "lower_column_text", None)
+
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
         # Determines whether a row matches all active substring filters.
-        if not self.column_filters:
+        if not self._text_cols:
             return True
 
-        src = self.sourceModel()
-        if src is None:
+        lower_text = self._lower_text
+        if lower_text is None:
             return True
 
-        for col_idx, text in self.column_filters.items():
-            if not text:
-                continue
-
-            idx = src.index(source_row, col_idx, source_parent)
-            val = src.data(idx, Qt.DisplayRole)
-            sval = ("" if val is None else str(val)).lower()
-
-            if text not in sval:
+        # Blank filters were dropped in set_filters(); filter text arrives trimmed and lowercased
+        # from the parts filter dialog
+        for col_idx, text in self._text_cols:
+            if text not in lower_text(col_idx)[source_row]:
                 return False
 
         return True
\ No newline at end of file
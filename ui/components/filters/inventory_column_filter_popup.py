@@ -1,9 +1,13 @@
 from __future__ import annotations
 from typing import Dict, Set
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QCursor
+from PySide6.QtGui import QStandardItemModel
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QDialog,
                                QCheckBox, QScrollArea)
+from core.utils import pointing_cursor
+from ui.components.filters._filter_style import FILTER_WINDOW_QSS
+from ui.components.filters.filter_proxy_models import filtered_unique_values
+from ui.components.filters._value_list import (build_value_list, checked_values, set_all_checked,
+                                                set_boxes_checked, set_checked_values)
 
 """
 This module provides the UI logic for column-based filtering and visibility control within table 
@@ -21,6 +25,7 @@ def open_column_filter_popup(): Show filter options for one column.
 def open_filter_window(): Full filters & column visibility dialog.
  - def clear_filters_all(): Reset all filters and show all columns.
  - def apply_all(): Apply all filter and visibility changes.
+ - def sync_checks(): Reset the check marks from the current filters and visible columns.
 def clear_filters(): Clear all filters and reset table.
 """
 
@@ -36,11 +41,8 @@ def open_column_filter_popup(self, col_index: int):
     if col_name == "actions":
         return
 
-    filtered_items = self._get_current_filtered_items(exclude_col=col_name)
-    unique_values = sorted({
-        ("" if getattr(it, col_name, "") is None else str(getattr(it, col_name, "")))
-        for it in filtered_items
-    })
+    # Distinct values of this column among the rows the other active filters keep
+    unique_values = filtered_unique_values(self.base_model, self.active_column_filters, col_name)
 
     dlg = QDialog(self)
     dlg.setWindowTitle(f"Filter: {self.column_labels.get(col_name, col_name)}")
@@ -48,27 +50,14 @@ def open_column_filter_popup(self, col_index: int):
     v = QVBoxLayout(dlg)
     v.addWidget(QLabel(f"Filter by {self.column_labels.get(col_name, col_name)}"))
 
-    # The scroll area contains one checkbox per unique value for this column.
-    scroll = QScrollArea()
-    scroll.setWidgetResizable(True)
-    w = QWidget()
-    list_layout = QVBoxLayout(w)
-
     existing = self.active_column_filters.get(col_name)
     # No filter exists yet: all values are pre-selected by default.
     preselected = set(existing) if existing else set(unique_values)
 
-    cb_by_value: Dict[str, QCheckBox] = {}
-    for val in unique_values:
-        text = val if val else "(blank)"
-        cb = QCheckBox(text)
-        cb.setChecked(val in preselected)
-        list_layout.addWidget(cb)
-        cb_by_value[val] = cb
-
-    list_layout.addStretch()
-    scroll.setWidget(w)
-    v.addWidget(scroll)
+    # One checkable row per value, in a list view that only draws the rows on screen
+    value_list = build_value_list(unique_values, preselected, max_rows=None)
+    value_model = value_list.model()
+    v.addWidget(value_list, stretch=1)
 
     # Footer: Select All / Clear All / Apply
     footer = QHBoxLayout()
@@ -76,7 +65,7 @@ def open_column_filter_popup(self, col_index: int):
     btn_none = QPushButton("Clear All")
     btn_apply = QPushButton("Apply")
     for b in (btn_all, btn_none, btn_apply):
-        b.setCursor(QCursor(Qt.PointingHandCursor))
+        b.setCursor(pointing_cursor())
     footer.addWidget(btn_all)
     footer.addWidget(btn_none)
     footer.addStretch()
@@ -85,17 +74,15 @@ def open_column_filter_popup(self, col_index: int):
 
     def select_all():
         # Mark all possible values as selected.
-        for b in cb_by_value.values():
-            b.setChecked(True)
+        set_all_checked(value_model, True)
 
     def clear_all():
         # Uncheck all values.
-        for b in cb_by_value.values():
-            b.setChecked(False)
+        set_all_checked(value_model, False)
 
     def apply_and_close():
         # Build a set of chosen values.
-        chosen = {val for val, cb in cb_by_value.items() if cb.isChecked()}
+        chosen = checked_values(value_model)
         # Choosing 'none' or 'all' = treated as "no filter" for this column.
         if not chosen or len(chosen) == len(unique_values):
             self.active_column_filters.pop(col_name, None)
@@ -120,13 +107,27 @@ def open_filter_window(self):
 
     from PySide6.QtWidgets import (
         QDialog, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, QWidget,
-        QCheckBox, QPushButton, QFrame, QMessageBox
+        QCheckBox, QPushButton, QMessageBox
     )
-    from PySide6.QtCore import Qt
+
+    # The window built for the current data is kept on the page and reopened with its check
+    # marks brought back in line with the active filters and visible columns; it is only
+    # rebuilt once the model's data changes.
+    cached = getattr(self, "_filter_dialog_cache", None)
+    if cached is not None:
+        version, cached_dlg, sync_checks = cached
+        if version == self.base_model.data_version:
+            sync_checks()
+            cached_dlg.exec()
+            return
+        cached_dlg.deleteLater()
+        self._filter_dialog_cache = None
 
     dlg = QDialog(self)
     dlg.setWindowTitle("Filters & Columns")
     dlg.resize(520, 600)
+    # One stylesheet for every checkbox and title in the window
+    dlg.setStyleSheet(FILTER_WINDOW_QSS)
     outer = QVBoxLayout(dlg)
     outer.setSpacing(10)
 
@@ -139,60 +140,46 @@ def open_filter_window(self):
     wrap_layout = QVBoxLayout(wrap)
     wrap_layout.setSpacing(14)
 
-    self._checks_by_col: dict[str, list[QCheckBox]] = {}
+    # Value list model per column (checkable rows holding the raw values)
+    self._value_models_by_col: Dict[str, QStandardItemModel] = {}
+    value_models = self._value_models_by_col
 
     src_model = self.base_model
+    data_version = src_model.data_version
     headers = src_model.all_columns
-    data_items = src_model.items
 
     # Build a section for each column (except 'actions').
     for col_name in headers:
         if col_name == "actions":
             continue  # Skip non-filterable column
 
-        # Gather unique values present in this column.
-        values = sorted({
-            "" if getattr(it, col_name, "") is None else str(getattr(it, col_name, ""))
-            for it in data_items
-        })
+        # Unique values present in this column (cached on the model until its items change).
+        values = src_model.unique_values(col_name)
 
         title = QLabel(self.column_labels.get(col_name, col_name))
-        title.setStyleSheet('color:#00ff99; font: bold 13px "Segoe UI";')
+        title.setObjectName("filterColTitle")
         wrap_layout.addWidget(title)
 
-        checks = []
         existing = self.active_column_filters.get(col_name)
         preselected = set(existing) if existing else set(values)
 
-        # Create one checkbox per unique value.
-        for v in values:
-            cb = QCheckBox(v if v else "(blank)")
-            cb.setChecked(v in preselected)
-            cb.setStyleSheet("QCheckBox{color:#ddd;}")
-            wrap_layout.addWidget(cb)
-            checks.append(cb)
-
-        self._checks_by_col[col_name] = checks
-
-        # Visual separator between column sections.
-        sep = QFrame()
-        sep.setFrameShape(QFrame.HLine)
-        sep.setStyleSheet("background:#333; max-height:1px;")
-        wrap_layout.addWidget(sep)
+        # One checkable row per value, in a list view that only draws the rows on screen
+        value_list = build_value_list(values, preselected)
+        wrap_layout.addWidget(value_list)
+        self._value_models_by_col[col_name] = value_list.model()
 
     wrap_layout.addStretch(1)
     scroll.setWidget(wrap)
 
     # Visible columns section: choose which columns to show/hide.
     col_label = QLabel("Visible Columns")
-    col_label.setStyleSheet('color:#00ff99; font: bold 14px "Segoe UI";')
+    col_label.setObjectName("filterSectionTitle")
     outer.addWidget(col_label)
 
     visible_checks: dict[str, QCheckBox] = {}
     for col_name in headers:
         cb = QCheckBox(self.column_labels.get(col_name, col_name))
         cb.setChecked(col_name in self.visible_columns)
-        cb.setStyleSheet("QCheckBox{color:#ddd;}")
         outer.addWidget(cb)
         visible_checks[col_name] = cb
 
@@ -203,7 +190,7 @@ def open_filter_window(self):
     btn_apply = QPushButton("Apply")
     btn_close = QPushButton("Close")
     for b in (btn_clear_filters, btn_apply, btn_close):
-        b.setCursor(QCursor(Qt.PointingHandCursor))
+        b.setCursor(pointing_cursor())
     footer.addWidget(btn_clear_filters)
     footer.addWidget(btn_apply)
     footer.addWidget(btn_close)
@@ -216,17 +203,20 @@ def open_filter_window(self):
         self._update_header_icons()
 
         # Reset all per-column checkboxes to "checked".
-        for checks in self._checks_by_col.values():
-            for cb in checks:
-                cb.setChecked(True)
+        # (every value list repaints once, after all of them are updated)
+        wrap.setUpdatesEnabled(False)
+        try:
+            for model in self._value_models_by_col.values():
+                set_all_checked(model, True)
+        finally:
+            wrap.setUpdatesEnabled(True)
 
         # Make all columns visible again.
         self.visible_columns = list(self.all_columns)
         self._apply_visible_columns()
 
         # Reset the "Visible Columns" checkboxes too.
-        for cb in visible_checks.values():
-            cb.setChecked(True)
+        set_boxes_checked(visible_checks.values(), True)
 
         dlg.accept()
 
@@ -236,11 +226,10 @@ def open_filter_window(self):
         new_filters: Dict[str, Set[str]] = {}
 
         # Build filters from the scrollable column sections.
-        for col, cbs in self._checks_by_col.items():
-            selected = {cb.text() if cb.text() != "(blank)" else "" for cb in cbs if cb.isChecked()}
-            all_vals = {cb.text() if cb.text() != "(blank)" else "" for cb in cbs}
+        for col, model in self._value_models_by_col.items():
+            selected = checked_values(model)
             # Only treat as a filter if not all (or none) are selected.
-            if selected and selected != all_vals:
+            if selected and len(selected) != model.rowCount():
                 new_filters[col] = selected
 
         self.active_column_filters = new_filters
@@ -256,10 +245,27 @@ def open_filter_window(self):
         self._apply_visible_columns()
         dlg.accept()
 
+    def sync_checks():
+        # Re-checks every value and "Visible Columns" box from the page's current filters and
+        # visible columns (the state the window would be built with).
+        wrap.setUpdatesEnabled(False)
+        try:
+            for col, model in value_models.items():
+                existing = self.active_column_filters.get(col)
+                if existing:
+                    set_checked_values(model, set(existing))
+                else:
+                    set_all_checked(model, True)
+        finally:
+            wrap.setUpdatesEnabled(True)
+        for col, cb in visible_checks.items():
+            cb.setChecked(col in self.visible_columns)
+
     btn_clear_filters.clicked.connect(clear_filters_all)
     btn_apply.clicked.connect(apply_all)
     btn_close.clicked.connect(dlg.reject)
 
+    self._filter_dialog_cache = (data_version, dlg, sync_checks)
     dlg.exec()
 
 # Clear filters button (toolbar); quick 'reset all' button, refreshes table completely.
@@ -273,7 +279,5 @@ def clear_filters(self):
     self.visible_columns = list(self.all_columns)
     self._apply_visible_columns()
 
-    # Force a full refresh of the proxy and table display.
-    self.proxy.invalidate()
-    self.table.reset()
+    # Repaint once; set_filters() above already re-evaluated every row.
     self.table.viewport().update()
\ No newline at end of file
@@ -1,6 +1,9 @@
 from PySide6.QtCore import Qt, Signal, QEvent
 from PySide6.QtWidgets import QStyledItemDelegate, QComboBox, QWidget, QAbstractItemDelegate
+import logging
+import os
 import sqlite3
+from core.models.inventory_model import model_signals
 
 """
 Custom Qt item delegate for selecting part numbers inside a table view.
@@ -11,7 +14,8 @@ inventory database. It is used to allow users to choose a valid part directly
 from a dropdown within a table cell.
 
 Key responsibilities:
-- Create a QComboBox editor populated with parts from `inventory_items`.
+- Create a QComboBox editor populated with parts from `inventory_items`, read
+  once and reused until the inventory (or the database file) changes.
 - Prevent automatic or unintended commits by tracking real user interactions.
 - Handle the full Qt delegate lifecycle (createEditor, setEditorData,
   setModelData, updateEditorGeometry, eventFilter).
@@ -23,7 +27,9 @@ selection is required.
 ui.components.part_combo_delegate.py index:
 class PartComboDelegate: Retrieves part #'s from inventory for drop-down 'part replaced' cell in SA
  - def __init__(): Stores the database path and initializes the delegate’s state.
- - def createEditor(): Builds the combo box editor and populates it with part numbers from the database.
+ - def _invalidate_parts(): Forgets the cached part numbers so the next editor reloads them.
+ - def _load_parts(): Returns the in-stock part numbers, querying the database only when the cache is stale.
+ - def createEditor(): Builds the combo box editor and populates it with the cached part numbers.
  - def _on_user_activated(): Marks that the user has actively selected a value in the dropdown.
  - def commitAndCloseEditor(): Commits the current dropdown value to the model and closes the editor.
  - def setEditorData(): Preloads the editor with the cell’s existing value when editing starts.
@@ -32,6 +38,9 @@ class PartComboDelegate: Retrieves part #'s from inventory for drop-down 'part r
  - def eventFilter(): Controls commit behavior on focus changes, prevents accidental auto-commits
 """
 
+logger = logging.getLogger(__name__)
+
+
 class PartComboDelegate(QStyledItemDelegate):
 # Retrieves part #'s from inventory for drop-down 'part replaced' cell in SA
     commitData = Signal(QWidget)
@@ -41,9 +50,43 @@ class PartComboDelegate(QStyledItemDelegate):
         super().__init__(parent)
         self.db_path = db_path
         self._user_interacted = False  # NEW FLAG
+        # In-stock part numbers, and the database file's modification time when they were read
+        self._parts_cache: list[str] | None = None
+        self._cache_mtime = 0.0
+        model_signals.inventory_changed.connect(self._invalidate_parts)
+
+    def _invalidate_parts(self):
+    # Inventory was written through the app; reload the part numbers on the next edit.
+        self._parts_cache = None
+
+    def _load_parts(self) -> list[str]:
+    # Returns the in-stock part numbers. The database is only queried on first use, after an
+    # inventory change, or when the database file was modified outside this delegate's knowledge.
+        try:
+            mtime = os.path.getmtime(self.db_path)
+        except OSError:
+            mtime = 0.0
+        if self._parts_cache is not None and mtime == self._cache_mtime:
+            return self._parts_cache
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            # Read-only lookup
+            conn.execute("PRAGMA query_only = 1")
+            parts = [pn for (pn,) in conn.execute("SELECT part_number FROM inventory_items WHERE quantity > 0")]
+        except Exception:
+            logger.exception("Loading parts from inventory_items failed")
+            # Not cached, so the next editor tries again
+            return []
+        finally:
+            conn.close()
+
+        self._parts_cache = parts
+        self._cache_mtime = mtime
+        return parts
 
     def createEditor(self, parent, option, index):
-    # Builds the combo box editor and populates it with part numbers from the database.
+    # Builds the combo box editor and populates it with part numbers (cached, see _load_parts).
         print("DEBUG: PartComboDelegate.createEditor at row", index.row())
         editor = QComboBox(parent)
 
@@ -51,19 +94,8 @@ class PartComboDelegate(QStyledItemDelegate):
         editor.addItem("")  # appears empty in dropdown
         editor.setCurrentIndex(-1)  # no default selection
 
-        # Load parts from DB
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        try:
-            cur.execute("SELECT part_number FROM inventory_items WHERE quantity > 0")
-            parts = cur.fetchall()
-        except Exception as e:
-            print("DEBUG: ERROR loading parts from inventory_items:", e)
-            parts = []
-        conn.close()
-
-        for (pn,) in parts:
-            editor.addItem(pn)
+        # Part numbers from the inventory, added in one call
+        editor.addItems(self._load_parts())
 
         # Pure user action tracking
         editor.activated.connect(self._on_user_activated)
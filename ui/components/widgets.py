@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel, QWidget
 from PySide6.QtCore import Qt, QTimer
-from datetime import date
+from datetime import date, datetime, time, timedelta
 import calendar
 from core.logic import get_current_user
 from core.models.inventory_model import InventoryItem
@@ -16,17 +16,38 @@ levels within the application.
 
 ui.components.widgets.py index: 
 
+def _ms_until_next_midnight(): Milliseconds from now until just after the next local midnight
+def _start_midnight_timer(): Single-shot timer that fires the given slot just after midnight
 class InventoryCountdownWidget: Displays countdown to next verification date
  - def __init__(): Initialize widget + setup visual layout/timer
+ - def _on_midnight(): Refresh the countdown and re-arm the timer for the next midnight
  - def update_countdown(): Compute days remaining to next quarterly inv. date
 class MileageCountdownWidget: Widget to display countdown to the last day of current month
  - def __init__(): Build countdown UI and start timer.
+ - def _on_midnight(): Refresh the countdown and re-arm the timer for the next midnight
  - def update_countdown(): Compute days remaining to end of current month
 class TonerLevelsWidget: detects printer models from inventory, colors, quantities
  - def __init__(): Build countdown UI and start timer.
- - def toner_color(): Color helper
+ - def showEvent(): Builds the bar chart the first time the widget is shown
+ - def _build_plot(): Imports pyqtgraph and draws one bar per toner slot
 """
 
+def _ms_until_next_midnight() -> int:
+    # Milliseconds until one second past the next local midnight, when the day counts change.
+    now = datetime.now()
+    tomorrow = datetime.combine(now.date() + timedelta(days=1), time.min)
+    return int((tomorrow - now).total_seconds() * 1000) + 1000
+
+def _start_midnight_timer(parent, slot) -> QTimer:
+    # Starts a single-shot timer (owned by 'parent') that calls 'slot' just after the next
+    # midnight; the slot re-arms it with a fresh interval, so the countdowns wake once a day at
+    # the moment their value changes instead of at a drifting 24-hour offset.
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.timeout.connect(slot)
+    timer.start(_ms_until_next_midnight())
+    return timer
+
 class InventoryCountdownWidget(QFrame):
 # Displays a countdown widget to the next quarterly inventory verification date (Q1: 31Mar, Q2: 30Jun,
 # Q3: 30Sep, Q4: 31Dec). Shows "Next Quarterly Inventory", "<N> days", "Target Date: Month, DD, YYYY".
@@ -57,10 +78,15 @@ class InventoryCountdownWidget(QFrame):
         for w in (self.title, self.days_label, self.date_label):
             layout.addWidget(w, alignment=Qt.AlignCenter)
 
+        # Last (days left, color) shown, so a refresh with nothing new skips the restyle
+        self._shown = None
+        self.update_countdown()
+        self._timer = _start_midnight_timer(self, self._on_midnight)
+
+    def _on_midnight(self):
+    # Refresh the countdown for the new day and wait for the next midnight.
         self.update_countdown()
-        timer = QTimer(self)
-        timer.timeout.connect(self.update_countdown)
-        timer.start(86400000)
+        self._timer.start(_ms_until_next_midnight())
 
     # Countdown logic
     def update_countdown(self):
@@ -87,13 +113,20 @@ class InventoryCountdownWidget(QFrame):
         elif days_left <= 45:
             color = "#FFD700"
 
+        # Nothing changed since the last refresh
+        if self._shown == (days_left, color):
+            return
+        restyle = self._shown is None or self._shown[1] != color
+        self._shown = (days_left, color)
+
         # Set text like "<N> days"
         self.days_label.setText(f"{days_left} days")
 
-        # Apply style with dynamic color
-        self.days_label.setStyleSheet(
-            f"font-weight: bold; font-size: 36px; color: {color};"
-        )
+        # Apply style with dynamic color (only when the color changes; restyling is costly)
+        if restyle:
+            self.days_label.setStyleSheet(
+                f"font-weight: bold; font-size: 36px; color: {color};"
+            )
         # Show the actual date in readable form (e.g. "Target Date: June 30, 2025")
         self.date_label.setText(
             f"Target Date: {next_q.strftime('%B %d, %Y')}"
@@ -134,11 +167,17 @@ class MileageCountdownWidget(QFrame):
         layout.addWidget(self.days_label)
         layout.addWidget(self.target_label)
 
+        # Last (days left, color) shown, so a refresh with nothing new skips the restyle; the
+        # label starts out green
+        self._shown = (None, "#00FF7F")
         self.update_countdown()
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_countdown)
-        self.timer.start(86400000)
+        self.timer = _start_midnight_timer(self, self._on_midnight)
+
+    def _on_midnight(self):
+    # Refresh the countdown for the new day and wait for the next midnight.
+        self.update_countdown()
+        self.timer.start(_ms_until_next_midnight())
 
     def update_countdown(self):
     # Compute days remaining to end of current month + update display accordingly.
@@ -146,10 +185,6 @@ class MileageCountdownWidget(QFrame):
         last_day = calendar.monthrange(today.year, today.month)[1]
         target_date = date(today.year, today.month, last_day)
         days_left = (target_date - today).days
-        self.days_label.setText(f"{days_left} days")
-        self.target_label.setText(
-            f"Target Date: {target_date.strftime('%B %d, %Y')}"
-        )
 
         if days_left <= 5:
             color = "#FF5555"  # red (very urgent)
@@ -158,14 +193,34 @@ class MileageCountdownWidget(QFrame):
         else:
             color = "#00FF7F"  # green (safe)
 
-        self.days_label.setStyleSheet(
-            f"font-weight: bold; font-size: 36px; color: {color};"
+        # Nothing changed since the last refresh
+        if self._shown == (days_left, color):
+            return
+        restyle = self._shown[1] != color
+        self._shown = (days_left, color)
+
+        self.days_label.setText(f"{days_left} days")
+        self.target_label.setText(
+            f"Target Date: {target_date.strftime('%B %d, %Y')}"
         )
 
+        # Restyle only when the color changes; setStyleSheet() re-polishes the label
+        if restyle:
+            self.days_label.setStyleSheet(
+                f"font-weight: bold; font-size: 36px; color: {color};"
+            )
+
 class TonerLevelsWidget(QWidget):
 # Dynamic toner level widget; detects printer models from inventory, colors (black, cyan,
 # magenta, yellow), quantities per printer+toner type. Only displays those toner items.
     VALID_COLORS = ("BLACK", "CYAN", "MAGENTA", "YELLOW")
+    # Bar color per toner color name
+    TONER_RGB = {
+        "BLACK": (30, 30, 30),
+        "CYAN": (0, 180, 255),
+        "MAGENTA": (255, 0, 150),
+        "YELLOW": (255, 220, 0),
+    }
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -174,64 +229,47 @@ class TonerLevelsWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(6)
+        # The chart (and the pyqtgraph import) is built on first show, so a dashboard that never
+        # displays this widget skips both.
+        self._plot_built = False
 
         title = QLabel("Toner Levels (Max 100)")
         title.setAlignment(Qt.AlignLeft)
         title.setStyleSheet("color: #ffffff; font: bold 14px 'Segoe UI';")
         layout.addWidget(title)
 
-        # Load inventory for the current user
+        # Toner stock for the current user, already filtered and summed per (model, description)
         user = get_current_user() or "default_user"
-        items = InventoryItem.get_all_for_user(user=user)
-
-        # Extract (model, tonerColor) pairs dynamically
-        toner_pairs = []
-        qty_map = {}
-
-        for it in items:
-            model = (it.model or "").strip().upper()
-            desc = (it.part_description or "").strip().upper()
-
-            if not model or not desc:
-                continue
-
-            if not any(color in desc for color in self.VALID_COLORS):
-                continue
-
-            if "TONER" not in desc:
-                continue
+        rows = InventoryItem.get_toner_summary_for_user(user=user)
 
-            key = (model, desc)
-            color_name = next(c for c in self.VALID_COLORS if c in desc)
-            label = f"{model} {color_name}"
-
-            toner_pairs.append((key, label))
-            qty_map[key] = qty_map.get(key, 0) + max(0, it.quantity or 0)
-
-        # Remove duplicates (maintain order)
-        seen = set()
-        unique_slots = []
-        for key, label in toner_pairs:
-            if key not in seen:
-                seen.add(key)
-                unique_slots.append((key, label))
-        toner_slots = unique_slots
+        # One slot per row: its label, color name and summed quantity (the color was matched
+        # in the query)
+        self._toner_slots = [
+            (f"{model} {color_name}", color_name, qty or 0) for model, color_name, qty in rows
+        ]
 
-        if not toner_slots:
+        if not self._toner_slots:
             empty_label = QLabel("No toner items found in inventory.")
             empty_label.setStyleSheet("color: #ffffff; font-size: 12px;")
             layout.addWidget(empty_label)
-            return
+            self._plot_built = True
+
+    def showEvent(self, event):
+        # Build the bar chart the first time the widget is shown.
+        if not self._plot_built:
+            self._build_plot()
+        super().showEvent(event)
+
+    def _build_plot(self):
+        # Draws one bar per toner slot. pyqtgraph is imported here, on first show only (Python
+        # caches the module, so later widgets do not pay for the import again).
+        self._plot_built = True
+        toner_slots = self._toner_slots
 
         # Prepare data arrays for bar chart
         MAX_LEVEL = 100
-        categories = [label for (_, label) in toner_slots]
-        values = []
-
-        for key, _ in toner_slots:
-            qty = qty_map.get(key, 0)
-            qty = max(0, min(MAX_LEVEL, qty))
-            values.append(qty)
+        categories = [label for (label, _, _) in toner_slots]
+        values = [min(MAX_LEVEL, qty) for (_, _, qty) in toner_slots]
 
         # Build bar chart using PyQtGraph
         import pyqtgraph as pg
@@ -250,20 +288,9 @@ class TonerLevelsWidget(QWidget):
         x_positions = list(range(len(categories)))
         BAR_WIDTH = 0.6
 
-        def toner_color(desc):
-            if "BLACK" in desc:
-                return (30, 30, 30)
-            if "CYAN" in desc:
-                return (0, 180, 255)
-            if "MAGENTA" in desc:
-                return (255, 0, 150)
-            if "YELLOW" in desc:
-                return (255, 220, 0)
-            return (180, 180, 180)
-
         # Draw bars dynamically
-        for idx, ((model, desc), label) in enumerate(toner_slots):
-            color = toner_color(desc)
+        for idx, (_, color_name, _) in enumerate(toner_slots):
+            color = self.TONER_RGB[color_name]
             bar = pg.BarGraphItem(
                 x=[idx],
                 height=[values[idx]],
@@ -285,6 +312,6 @@ class TonerLevelsWidget(QWidget):
         axis_y.setStyle(tickFont=pg.QtGui.QFont("Segoe UI", 8))
         axis_y.setPen(pg.mkPen(255, 255, 255))
         axis_y.setTextPen(pg.mkPen(255, 255, 255))
-        layout.addWidget(plot)
+        self.layout().addWidget(plot)
 
 
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set
 from PySide6.QtCore import Qt, QModelIndex, QPoint, QTimer
 from PySide6.QtGui import QCursor
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableView,
@@ -36,7 +36,6 @@ class EquipmentInfoPage(): Main equipment management screen.
 - def _apply_visible_columns(): Show/hide table columns.
 - def _update_header_icons(): Add filter arrow to filtered columns.
 - def _on_header_context_menu(): Open column filter popup on right-click.
-- def _get_current_filtered_items(): Return items after applying active filters.
 - def _actions_logical_index(): Get index of “actions” column.
 - def _ensure_actions_width(): Force actions column to required width.
 - def show_help_dialog(): Open equipment help modal.
@@ -404,20 +403,6 @@ class EquipmentInfoPage(QWidget):
         col_index = logical
         self.open_column_filter_popup(col_index)
 
-    # Helper for filtering pipeline
-    def _get_current_filtered_items(self, exclude_col: Optional[str] = None) -> List[EquipmentInfo]:
-        filtered: List[EquipmentInfo] = self.base_model.items
-        for col_name, allowed_set in self.active_column_filters.items():
-            if exclude_col and col_name == exclude_col:
-                continue
-            filtered = [
-                it
-                for it in filtered
-                if ("" if getattr(it, col_name, "") is None else str(getattr(it, col_name, "")))
-                in allowed_set
-            ]
-        return filtered
-
     # Actions column width management
     def _actions_logical_index(self, width: int = 200) -> int:
         # Find index of 'actions' column in all_columns list.
@@ -446,5 +431,5 @@ class EquipmentInfoPage(QWidget):
             header.resizeSection(li, width)
 
     def show_help_dialog(self):
-        dlg = EquipmentHelpDialog(self)
-        dlg.exec()
\ No newline at end of file
+        # Built on the first click only, then reused
+        EquipmentHelpDialog.show_for(self)
\ No newline at end of file
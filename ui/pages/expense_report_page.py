@@ -355,6 +355,8 @@ class ExpenseReportPage(QWidget):
         QTimer.singleShot(0, self._ensure_actions_width)
         self.base_model.modelReset.connect(self._ensure_actions_width)
         self.base_model.layoutChanged.connect(self._ensure_actions_width)
+        self.base_model.rowsInserted.connect(self._ensure_actions_width)
+        self.base_model.rowsRemoved.connect(self._ensure_actions_width)
 
         # Double-click row > edit
         self.table.doubleClicked.connect(self._on_double_click)
@@ -416,7 +418,7 @@ class ExpenseReportPage(QWidget):
         self.table.resizeColumnsToContents()
         QTimer.singleShot(0, self._ensure_actions_width)
 
-    def _ensure_actions_width(self):
+    def _ensure_actions_width(self, *args):
         # Ensures the actions column width matches the delegate's requirements.
         li = self._actions_logical_index()
         if li < 0:
@@ -781,5 +783,5 @@ class ExpenseReportPage(QWidget):
 
     # Create the Help button & help dialog
     def show_help_dialog(self):
-        dlg = ExpenseHelpDialog(self)
-        dlg.exec()
\ No newline at end of file
+        # Built on the first click only, then reused
+        ExpenseHelpDialog.show_for(self)
\ No newline at end of file
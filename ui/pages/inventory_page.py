@@ -45,7 +45,6 @@ class InventoryPage: Main inventory management screen.
  - def delete_selected(): Delete currently selected item.
  - def order_selected(): Order currently selected item.
  - def _on_header_context_menu(): Right-click header > column filter popup.
- - def _get_current_filtered_items(): Return items passing active filters.
  - def open_add_form(): Open new inventory item form.
  - def open_edit_form(): Open edit inventory item form.
  - def _after_save(): Refresh data and notify other pages.
@@ -326,6 +325,8 @@ class InventoryPage(QWidget):
 
             self.base_model.modelReset.connect(self._ensure_actions_width)
             self.base_model.layoutChanged.connect(self._ensure_actions_width)
+            self.base_model.rowsInserted.connect(self._ensure_actions_width)
+            self.base_model.rowsRemoved.connect(self._ensure_actions_width)
 
         if "id" in self.visible_columns:
             self.visible_columns.remove("id")
@@ -486,20 +487,6 @@ class InventoryPage(QWidget):
         col_index = logical
         self.open_column_filter_popup(col_index)
 
-    def _get_current_filtered_items(self, exclude_col: Optional[str] = None) -> List[Any]:
-        # Return the list of items that pass all active filters, optionally ignoring
-        # a single column's filter (used so that filter popup can see the "raw" values)
-
-        filtered = self.base_model.items
-        for col_name, allowed_set in self.active_column_filters.items():
-            if exclude_col and col_name == exclude_col:
-                continue
-            filtered = [
-                it for it in filtered
-                if ("" if getattr(it, col_name, "") is None else str(getattr(it, col_name, ""))) in allowed_set
-            ]
-        return filtered
-
     # Open add/edit forms; create a dialog that blocks until user clicks 'save'/'cancel'. On
     # successful save, dialog notifies page to reload data.
     def open_add_form(self):
@@ -585,7 +572,7 @@ class InventoryPage(QWidget):
         except ValueError:
             return -1
 
-    def _ensure_actions_width(self):
+    def _ensure_actions_width(self, *args):
         # Ensures the actions column width matches the delegate's requirements.
 
         li = self._actions_logical_index()
@@ -608,5 +595,5 @@ class InventoryPage(QWidget):
             header.resizeSection(li, width)
 
     def show_help_dialog(self):
-        dlg = InventoryHelpDialog(self)
-        dlg.exec()
+        # Built on the first click only, then reused
+        InventoryHelpDialog.show_for(self)
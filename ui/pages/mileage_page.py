@@ -294,8 +294,8 @@ class MileagePage(QWidget):
         self.proxy = MileageFilterProxy(self.columns, self)
         self.proxy.setSourceModel(self.base_model)
 
-        # Connect model to table
-        self.table.setModel(self.proxy)
+        # Connect model to table (the proxy re-sorts on demand, not on every edit)
+        self.table.set_source_model(self.proxy)
 
         # Hide database ID column
         id_col = self.columns.index("id")
@@ -319,6 +319,8 @@ class MileagePage(QWidget):
         QTimer.singleShot(0, self._ensure_actions_width)
         self.base_model.modelReset.connect(self._ensure_actions_width)
         self.base_model.layoutChanged.connect(self._ensure_actions_width)
+        self.base_model.rowsInserted.connect(self._ensure_actions_width)
+        self.base_model.rowsRemoved.connect(self._ensure_actions_width)
 
         # Double click > Edit a record
         self.table.doubleClicked.connect(self._on_double_click)
@@ -329,8 +331,12 @@ class MileagePage(QWidget):
     # Load items into table
     def load_items(self):
         items = MileageEntry.get_all_for_user(self.user)
-        self.base_model.set_items(items)
-        self.table.resizeColumnsToContents()
+        self.table.begin_bulk_update()
+        try:
+            self.base_model.set_items(items)
+            self.table.resizeColumnsToContents()
+        finally:
+            self.table.end_bulk_update()
 
         # Ensure actions column resizes correctly after loading
         QTimer.singleShot(0, self._ensure_actions_width)
@@ -436,7 +442,7 @@ class MileagePage(QWidget):
     # Exports the mileage entries and header info into the Excel report template.
 
         # Ensure data is in entry
-        if self.base_model.rowCount() == 0:
+        if not self.base_model.items():
             QMessageBox.information(self, "No Data", "There are no mileage entries to export.")
             return
 
@@ -513,8 +519,7 @@ class MileagePage(QWidget):
                 return None
 
             export_items = []
-            for row in range(self.base_model.rowCount()):
-                entry = self.base_model.get_item(row)
+            for entry in self.base_model.items():
                 d = to_date(getattr(entry, "date", None))
                 if d and begin_date <= d <= end_date:
                     export_items.append((entry, d))
@@ -593,7 +598,7 @@ class MileagePage(QWidget):
         except ValueError:
             return -1
 
-    def _ensure_actions_width(self):
+    def _ensure_actions_width(self, *args):
         # Ensures the actions column width matches the delegate's requirements.
         li = self._actions_logical_index()
         if li < 0:
@@ -609,5 +614,5 @@ class MileagePage(QWidget):
             header.resizeSection(li, width)
 
     def show_help_dialog(self):
-        dlg = MileageHelpDialog(self)
-        dlg.exec()
\ No newline at end of file
+        # Built on the first click only, then reused
+        MileageHelpDialog.show_for(self)
\ No newline at end of file
@@ -241,6 +241,8 @@ class PartsPage(QWidget):
             QTimer.singleShot(0, self._ensure_actions_width)
             self.base_model.modelReset.connect(self._ensure_actions_width)
             self.base_model.layoutChanged.connect(self._ensure_actions_width)
+            self.base_model.rowsInserted.connect(self._ensure_actions_width)
+            self.base_model.rowsRemoved.connect(self._ensure_actions_width)
 
         # Let the user resize it manually
         header.setSectionResizeMode(actions_col, QHeaderView.Interactive)
@@ -347,7 +349,7 @@ class PartsPage(QWidget):
         except ValueError:
             return -1
 
-    def _ensure_actions_width(self):
+    def _ensure_actions_width(self, *args):
         # Ensures the actions column width matches the delegate's requirements.
         li = self._actions_logical_index()
         if li < 0:
@@ -455,5 +457,5 @@ class PartsPage(QWidget):
             QMessageBox.critical(self, "Error Exporting CSV", str(e))
 
     def show_help_dialog(self):
-        dlg = PartsHelpDialog(self)
-        dlg.exec()
\ No newline at end of file
+        # Built on the first click only, then reused
+        PartsHelpDialog.show_for(self)
\ No newline at end of file
@@ -39,7 +39,6 @@ class ServiceActivityPage(): Main UI for service activity records.
  - def delete_selected(): Delete selected row.
  - def _do_delete(): Perform delete + restock inventory.
  - def _on_header_context_menu(): Header right-click column filter.
- - def _get_current_filtered_items(): Items passing active filters.
  - def open_add_form(): Open new activity form.
  - def open_edit_form(): Open edit form.
  - def _actions_logical_index(): Find actions column index.
@@ -499,24 +498,6 @@ class ServiceActivityPage(QWidget):
         col_index = logical
         self.open_column_filter_popup(col_index)
 
-    def _get_current_filtered_items(
-        self,
-        exclude_col: Optional[str] = None
-    ) -> List[ServiceActivity]:
-        # Returns a list of items that pass all active filters & optionally ignores a specific
-        # columns filter (so the popup sees all values for the column being changed.
-        filtered = self.base_model.items
-        for col_name, allowed_set in self.active_column_filters.items():
-            if exclude_col and col_name == exclude_col:
-                continue
-            filtered = [
-                it
-                for it in filtered
-                if ("" if getattr(it, col_name, "") is None
-                    else str(getattr(it, col_name, ""))) in allowed_set
-            ]
-        return filtered
-
     # Forms (Add / Edit)
     def open_add_form(self):
         # Opens new ServiceActivityForm for a new record, the form calls self.load_items()
@@ -563,5 +544,5 @@ class ServiceActivityPage(QWidget):
             header.resizeSection(li, width)
 
     def show_help_dialog(self):
-        dlg = ServiceActivityHelpDialog(self)
-        dlg.exec()
+        # Built on the first click only, then reused
+        ServiceActivityHelpDialog.show_for(self)